@@ -18,30 +18,50 @@ class DNSChecker(BaseChecker):
         """Initialize DNS checker with optional custom nameservers."""
         super().__init__(timeout)
         self.nameservers = nameservers
-        # Cache of last resolved IPs per target
-        self._resolved_ips: dict[str, str] = {}
+        # Cache of last resolved IPs per (target, ip_version)
+        self._resolved_ips: dict[tuple[str, int | None], str] = {}
 
-    def get_last_resolved_ip(self, target: str) -> str | None:
+    def get_last_resolved_ip(self, target: str, ip_version: int | None = None) -> str | None:
         """Get the last successfully resolved IP for a target.
 
         Args:
             target: The domain name that was resolved
+            ip_version: IP version preference used for the resolution (4, 6 or None)
 
         Returns:
-            The last resolved IP address, or None if never resolved
+            The last resolved IP address, or None if never resolved or the last
+            resolution failed
         """
-        return self._resolved_ips.get(target)
+        return self._resolved_ips.get((target, ip_version))
 
     async def check(
         self, target: str, iteration_timestamp: datetime, ip_version: int | None = None
     ) -> CheckResult:
         """Perform DNS resolution check.
 
+        The resolved IP is cached for get_last_resolved_ip(). A failed resolution
+        drops the cached IP, so the other checks go back to the hostname instead of
+        hiding a DNS outage behind an IP that was resolved earlier.
+
         Args:
             target: Domain name to resolve
             iteration_timestamp: Timestamp for this iteration
             ip_version: Optional IP version preference (4 or 6)
         """
+        result = await self._resolve(target, iteration_timestamp, ip_version)
+
+        key = (target, ip_version)
+        if result.success and result.resolved_ip:
+            self._resolved_ips[key] = result.resolved_ip
+        else:
+            self._resolved_ips.pop(key, None)
+
+        return result
+
+    async def _resolve(
+        self, target: str, iteration_timestamp: datetime, ip_version: int | None
+    ) -> CheckResult:
+        """Resolve target and build the check result."""
         try:
             resolver = dns.asyncresolver.Resolver()
             resolver.timeout = self.timeout
@@ -95,10 +115,6 @@ class DNSChecker(BaseChecker):
             # Extract first IP address from answer for use in ICMP checks
             resolved_ip = str(answer[0]) if answer and len(answer) > 0 else None
 
-            # Cache the resolved IP for this target
-            if resolved_ip:
-                self._resolved_ips[target] = resolved_ip
-
             return self._create_result(
                 check_type=CheckType.DNS,
                 success=True,
@@ -1,9 +1,12 @@
 """HTTP/HTTPS request checker."""
 
+import socket
 import time
 from datetime import datetime
+from urllib.parse import urlparse
 
 import aiohttp
+from aiohttp.abc import AbstractResolver, ResolveResult
 
 from hydraping.checkers.base import BaseChecker
 from hydraping.models import CheckResult, CheckType
@@ -23,8 +26,17 @@ class HTTPChecker(BaseChecker):
         super().__init__(timeout)
         self.success_status_max = success_status_max
 
-    async def check(self, url: str, iteration_timestamp: datetime) -> CheckResult:
-        """Perform HTTP request check."""
+    async def check(
+        self, url: str, iteration_timestamp: datetime, resolved_ip: str | None = None
+    ) -> CheckResult:
+        """Perform HTTP request check.
+
+        Args:
+            url: URL to request
+            iteration_timestamp: Timestamp for this check iteration
+            resolved_ip: Optional already resolved IP of the URL's host, used instead
+                        of resolving the host again (Host header and SNI are unchanged)
+        """
         # Determine protocol from URL
         protocol = "https" if url.startswith("https://") else "http"
 
@@ -33,7 +45,12 @@ class HTTPChecker(BaseChecker):
             start_time = time.perf_counter()
 
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            connector = None
+            host = urlparse(url).hostname
+            if resolved_ip and host:
+                connector = aiohttp.TCPConnector(resolver=PinnedResolver(host, resolved_ip))
+
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
                 async with session.get(url, allow_redirects=True) as response:
                     # Read response to ensure full request completes
                     await response.read()
@@ -91,3 +108,38 @@ class HTTPChecker(BaseChecker):
                 error_message=f"HTTP error: {e}",
                 protocol=protocol,
             )
+
+
+class PinnedResolver(AbstractResolver):
+    """Resolver that answers lookups of one host with an already resolved IP.
+
+    Other hosts (e.g. redirect targets) are resolved normally.
+    """
+
+    def __init__(self, host: str, ip: str):
+        """Initialize resolver with the pinned host and its IP."""
+        self.host = host
+        self.ip = ip
+        self._fallback = aiohttp.ThreadedResolver()
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        """Resolve host, returning the pinned IP for the pinned host."""
+        if host != self.host:
+            return await self._fallback.resolve(host, port, family)
+
+        return [
+            ResolveResult(
+                hostname=host,
+                host=self.ip,
+                port=port,
+                family=socket.AF_INET6 if ":" in self.ip else socket.AF_INET,
+                proto=0,
+                flags=socket.AI_NUMERICHOST,
+            )
+        ]
+
+    async def close(self) -> None:
+        """Close the fallback resolver."""
+        await self._fallback.close()
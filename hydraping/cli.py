@@ -13,6 +13,11 @@ from hydraping.models import Endpoint
 from hydraping.orchestrator import CheckOrchestrator
 from hydraping.ui.dashboard import Dashboard, calculate_graph_width
 
+try:
+    import uvloop
+except ImportError:  # Optional extra (hydraping[uvloop]), the stdlib event loop works fine
+    uvloop = None
+
 app = typer.Typer(
     name="hydraping",
     help="Multi-protocol connection tester with live terminal UI",
@@ -83,9 +88,12 @@ def main(
     orchestrator = CheckOrchestrator(cfg, graph_width=graph_width)
     dashboard = Dashboard(orchestrator, console=console)
 
-    # Run the dashboard
+    # Run the dashboard, on uvloop when it is installed
+    # The loop is picked here rather than through a global event loop policy
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
     try:
-        asyncio.run(dashboard.run())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(dashboard.run())
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopped by user[/yellow]")
 
@@ -21,6 +21,7 @@ class ChecksConfig:
     interval_seconds: float = 5.0
     timeout_seconds: float = 5.0
     http_success_status_max: int = 399  # HTTP status codes <= this are considered success
+    max_concurrent_checks: int = 100  # Maximum number of checks performing network I/O at once
 
 
 @dataclass
@@ -51,8 +52,12 @@ class Config:
                 f"Run 'hydraping init' to create a default configuration."
             )
 
-        with config_path.open("rb") as f:
-            data = tomllib.load(f)
+        return Config.loads(config_path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def loads(text: str) -> "Config":
+        """Load configuration from a TOML string."""
+        data = tomllib.loads(text)
 
         # Parse endpoints
         endpoint_configs = data.get("endpoints", {}).get("targets", [])
@@ -143,9 +148,9 @@ class Config:
                 if primary_check:
                     # Parse check type from string
                     try:
-                        check_type = CheckType(primary_check.lower())
-                    except ValueError:
-                        valid_types = ", ".join([ct.value for ct in CheckType])
+                        check_type = CheckType[primary_check.upper()]
+                    except KeyError:
+                        valid_types = ", ".join([ct.name.lower() for ct in CheckType])
                         raise ValueError(
                             f"Invalid primary_check_type '{primary_check}' for {url}. "
                             f"Valid values: {valid_types}"
@@ -154,7 +159,7 @@ class Config:
                     # Validate the check type is applicable to this endpoint
                     applicable_checks = endpoint.get_check_types()
                     if check_type not in applicable_checks:
-                        applicable_str = ", ".join([ct.value for ct in applicable_checks])
+                        applicable_str = ", ".join([ct.name.lower() for ct in applicable_checks])
                         raise ValueError(
                             f"primary_check_type '{primary_check}' is not applicable "
                             f"to endpoint {url}. This endpoint supports: {applicable_str}"
@@ -182,8 +187,14 @@ class Config:
             interval_seconds=checks_data.get("interval_seconds", 5.0),
             timeout_seconds=checks_data.get("timeout_seconds", 5.0),
             http_success_status_max=checks_data.get("http_success_status_max", 399),
+            max_concurrent_checks=checks_data.get("max_concurrent_checks", 100),
         )
 
+        if checks.max_concurrent_checks < 1:
+            raise ValueError(
+                f"max_concurrent_checks must be at least 1, got: {checks.max_concurrent_checks}"
+            )
+
         # Validate timeout doesn't exceed interval
         if checks.timeout_seconds >= checks.interval_seconds:
             import warnings
@@ -265,6 +276,10 @@ timeout_seconds = 5.0
 # 299: Strict mode - only 2xx responses are successful
 http_success_status_max = 399
 
+# Maximum number of checks performing network I/O at the same time (default: 100)
+# Bounds open sockets when monitoring many endpoints; further checks wait their turn
+max_concurrent_checks = 100
+
 [ui]
 # Width of the latency graph (in characters)
 # Set to 0 to auto-size based on terminal width
@@ -2,29 +2,88 @@
 
 import ipaddress
 import time
-from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 from urllib.parse import urlparse
 
 
-class CheckType(str, Enum):
-    """Type of connectivity check."""
+class CheckType(IntEnum):
+    """Type of connectivity check.
 
-    DNS = "dns"
-    ICMP = "icmp"
-    TCP = "tcp"
-    UDP = "udp"
-    HTTP = "http"
+    The integer value doubles as the check's priority (higher is better), so
+    comparing two check types is a plain integer comparison. Values are
+    contiguous from zero, so they also index per-type lists.
+    """
 
+    ICMP = 0
+    DNS = 1
+    UDP = 2
+    TCP = 3
+    HTTP = 4
 
-# Check type priority order (highest to lowest)
+
+# Check type priority order (highest to lowest, matches descending CheckType values)
 # HTTP is the most comprehensive check (includes DNS, TCP, and application layer)
 # TCP/UDP verify port connectivity (includes DNS and transport layer)
 # DNS verifies name resolution only
 # ICMP is the basic network layer check
-CHECK_TYPE_PRIORITY = [CheckType.HTTP, CheckType.TCP, CheckType.UDP, CheckType.DNS, CheckType.ICMP]
+CHECK_TYPE_PRIORITY = (CheckType.HTTP, CheckType.TCP, CheckType.UDP, CheckType.DNS, CheckType.ICMP)
+
+
+class ResultRingBuffer:
+    """Fixed-capacity ring buffer of check results.
+
+    Storage is preallocated once, so appending never allocates; when the buffer
+    is full the oldest result is overwritten.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize an empty buffer.
+
+        Args:
+            capacity: Maximum number of results to keep
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive, got: {capacity}")
+        self.capacity = capacity
+        self._buffer: list[CheckResult | None] = [None] * self.capacity
+        self._index = 0  # Next write position
+        self._length = 0
+        self.appended = 0  # Total number of results ever appended
+
+    def append(self, result: "CheckResult") -> None:
+        """Append a result, overwriting the oldest one when full."""
+        self._buffer[self._index] = result
+        self._index += 1
+        if self._index == self.capacity:
+            self._index = 0
+        if self._length < self.capacity:
+            self._length += 1
+        self.appended += 1
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        return self._length
+
+    def __iter__(self) -> "Iterator[CheckResult]":
+        """Iterate over stored results from oldest to newest."""
+        if self._length < self.capacity:
+            return iter(self._buffer[: self._length])
+        return iter(self._buffer[self._index :] + self._buffer[: self._index])
+
+    def __reversed__(self) -> "Iterator[CheckResult]":
+        """Iterate over stored results from newest to oldest, without copying."""
+        buffer = self._buffer
+        # Negative positions index from the end of the list, which is exactly
+        # where the newest results continue after the write index wrapped
+        index = self._index
+        for offset in range(1, self._length + 1):
+            yield buffer[index - offset]
 
 
 class EndpointResultHistory:
@@ -57,11 +116,16 @@ class EndpointResultHistory:
             primary_check_type: Optional check type to filter for graph/latency display
         """
         self.interval_seconds = interval_seconds
-        self.results: deque[CheckResult] = deque(maxlen=max_capacity)
+        self.results = ResultRingBuffer(max_capacity)
         self.start_time = start_time  # Monotonic time for bucket calculation
         self.start_timestamp = start_timestamp  # Wall-clock time for result bucketing
         self.primary_check_type = primary_check_type  # Filter for graph/latency
-        self._priority_order = {check_type: i for i, check_type in enumerate(CHECK_TYPE_PRIORITY)}
+        # Most recent result per check type, indexed by CheckType
+        self._latest_by_type: list[CheckResult | None] = [None] * len(CheckType)
+        # Most recent result and its buffer position per (check type, port) - the checks
+        # of one type on different ports (e.g. TCP 80 and 443) coalesce separately
+        self._latest_by_check: dict[tuple[CheckType, int | None], tuple[CheckResult, int]] = {}
+        self.version = 0  # Bumped on every change, lets consumers cache derived views
 
     def add_result(self, result: "CheckResult") -> None:
         """Add a new check result.
@@ -75,9 +139,36 @@ class EndpointResultHistory:
             # start_timestamp = wall-clock time for result bucket calculation
             self.start_time = time.monotonic()
             self.start_timestamp = time.time()
+
+        # Coalesce a repeated failure into the previous result of the same check
+        # (e.g. a host that stays down) instead of filling the history with copies.
+        # Only extend entries in the newer half of the buffer, so an ongoing run
+        # is re-appended long before it could be overwritten.
+        # A run is only extended by a result in the next bucket at most - after a
+        # gap (e.g. system suspend) the empty buckets must not render as failures.
+        key = (result.check_type, result.port)
+        latest_check = self._latest_by_check.get(key)
+        if latest_check is not None:
+            latest, sequence = latest_check
+            if (
+                not result.success
+                and not latest.success
+                and latest.error_message == result.error_message
+                and self.results.appended - sequence < self.results.capacity // 2
+                and self._get_bucket_span(result)[0] <= self._get_bucket_span(latest)[1] + 1
+            ):
+                latest.repeat_count += 1
+                latest.last_timestamp = result.timestamp
+                self.version += 1
+                self._latest_by_type[result.check_type] = latest
+                return
+
         self.results.append(result)
+        self.version += 1
+        self._latest_by_type[result.check_type] = result
+        self._latest_by_check[key] = (result, self.results.appended)
 
-    def get_current_result(self) -> "CheckResult | None":
+    def get_current_result(self, now: float | None = None) -> "CheckResult | None":
         """Get the result for the current time bucket.
 
         This is what should be displayed "now" - the highest-priority result
@@ -88,79 +179,78 @@ class EndpointResultHistory:
         started), falls back to the previous bucket so the latency doesn't
         disappear between check iterations.
 
+        Args:
+            now: Wall-clock time to use (default: time.time())
+
         Returns:
             The current result to display, or None if no data yet
         """
         if self.start_time is None or self.start_timestamp is None or not self.results:
             return None
 
-        # Calculate current time bucket using wall-clock time
-        # (must match how we calculate result buckets)
-        now = time.time()
-        elapsed = now - self.start_timestamp
-        current_bucket = int(elapsed / self.interval_seconds)
+        current_bucket = self.get_current_bucket(now)
 
-        # Find highest-priority result in current bucket
+        # Find highest-priority result in the current and the previous bucket
+        # in a single pass over the history
         current_bucket_result = None
+        previous_bucket_result = None
+        previous_bucket = current_bucket - 1 if current_bucket > 0 else None
+        primary_check_type = self.primary_check_type
 
         for result in self.results:
             # Filter by primary check type if set
-            if self.primary_check_type and result.check_type != self.primary_check_type:
-                continue
-
-            timestamp_s = result.timestamp.timestamp()
-            elapsed_since_start = timestamp_s - self.start_timestamp
-            bucket = int(elapsed_since_start / self.interval_seconds)
-
-            # Only consider results in the current bucket
-            if bucket != current_bucket:
+            if primary_check_type is not None and result.check_type != primary_check_type:
                 continue
 
-            # Keep highest-priority result
-            if current_bucket_result is None:
-                current_bucket_result = result
-            else:
-                current_bucket_result = self._select_better_result(current_bucket_result, result)
-
-        # If no data in current bucket, fall back to previous bucket
-        # This prevents latency from disappearing between check iterations
-        if current_bucket_result is None and current_bucket > 0:
-            previous_bucket = current_bucket - 1
-            for result in self.results:
-                # Filter by primary check type if set
-                if self.primary_check_type and result.check_type != self.primary_check_type:
-                    continue
-
-                timestamp_s = result.timestamp.timestamp()
-                elapsed_since_start = timestamp_s - self.start_timestamp
-                bucket = int(elapsed_since_start / self.interval_seconds)
-
-                if bucket != previous_bucket:
-                    continue
+            first_bucket, last_bucket = self._get_bucket_span(result)
 
+            # Keep highest-priority result per bucket
+            if first_bucket <= current_bucket <= last_bucket:
                 if current_bucket_result is None:
                     current_bucket_result = result
                 else:
                     current_bucket_result = self._select_better_result(
                         current_bucket_result, result
                     )
+            if previous_bucket is not None and first_bucket <= previous_bucket <= last_bucket:
+                if previous_bucket_result is None:
+                    previous_bucket_result = result
+                else:
+                    previous_bucket_result = self._select_better_result(
+                        previous_bucket_result, result
+                    )
+
+        # If no data in current bucket, fall back to previous bucket
+        # This prevents latency from disappearing between check iterations
+        if current_bucket_result is None:
+            return previous_bucket_result
 
         return current_bucket_result
 
-    def get_current_bucket(self) -> int:
+    def get_current_bucket(self, now: float | None = None) -> int:
         """Get the current time bucket number.
 
+        Uses wall-clock time (must match how we calculate result buckets).
+        Callers rendering several histories can pass one shared ``now`` so
+        the clock is read once per frame and all rows agree on the bucket.
+
+        Args:
+            now: Wall-clock time to use (default: time.time())
+
         Returns:
             The current bucket number based on elapsed time since start
         """
         if self.start_timestamp is None:
             return 0
 
-        now = time.time()
+        if now is None:
+            now = time.time()
         elapsed = now - self.start_timestamp
         return int(elapsed / self.interval_seconds)
 
-    def get_bucketed_results(self, num_buckets: int) -> list["CheckResult | None"]:
+    def get_bucketed_results(
+        self, num_buckets: int, now: float | None = None
+    ) -> list["CheckResult | None"]:
         """Get bucketed results for the last N time buckets, ready to render.
 
         Returns a list of exactly num_buckets length, where each position
@@ -171,6 +261,7 @@ class EndpointResultHistory:
 
         Args:
             num_buckets: Number of recent buckets to return
+            now: Wall-clock time to use (default: time.time())
 
         Returns:
             List of CheckResult or None, with length exactly num_buckets.
@@ -180,49 +271,53 @@ class EndpointResultHistory:
             # No data yet - return all None
             return [None] * num_buckets
 
-        # Calculate current bucket range using wall-clock time
-        # (must match how we calculate result buckets)
-        now = time.time()
-        elapsed = now - self.start_timestamp
-        current_bucket = int(elapsed / self.interval_seconds)
+        current_bucket = self.get_current_bucket(now)
         start_bucket = max(0, current_bucket - num_buckets + 1)
         end_bucket = current_bucket + 1
 
-        # Build bucketed results dict first
-        results_by_bucket: dict[int, CheckResult] = {}
+        # Fill a list indexed by bucket directly - the list is exactly num_buckets long,
+        # early in monitoring (current_bucket < num_buckets - 1) the oldest positions stay None
+        result_list: list[CheckResult | None] = [None] * num_buckets
+        offset = num_buckets - end_bucket  # List index of a bucket = bucket + offset
+        primary_check_type = self.primary_check_type
+
+        # Walk from the newest result back and stop once no older one can reach the window.
+        # Results of one check (type and port) are stored in time order without overlapping
+        # (only the newest of a check is still extended by coalescing), so once a check has
+        # a result starting before the window, all its older results end before it as well.
+        open_checks = sum(
+            primary_check_type is None or check_type == primary_check_type
+            for check_type, _ in self._latest_by_check
+        )
+        closed: set[tuple[CheckType, int | None]] = set()
 
-        for result in self.results:
+        for result in reversed(self.results):
+            check_type = result.check_type
             # Filter by primary check type if set
-            if self.primary_check_type and result.check_type != self.primary_check_type:
+            if primary_check_type is not None and check_type != primary_check_type:
+                continue
+            key = (check_type, result.port)
+            if key in closed:
                 continue
-
-            timestamp_s = result.timestamp.timestamp()
-            elapsed_since_start = timestamp_s - self.start_timestamp
-            bucket = int(elapsed_since_start / self.interval_seconds)
 
             # Only include buckets in the requested range
-            if bucket < start_bucket or bucket >= end_bucket:
-                continue
+            # (coalesced failures cover every bucket from first to last occurrence)
+            first_bucket, last_bucket = self._get_bucket_span(result)
+            for index in range(
+                max(first_bucket, start_bucket) + offset, min(last_bucket + 1, end_bucket) + offset
+            ):
+                # Keep highest-priority result per bucket, the older one on a tie
+                current = result_list[index]
+                if current is None:
+                    result_list[index] = result
+                else:
+                    result_list[index] = self._select_better_result(result, current)
 
-            # Keep highest-priority result per bucket
-            if bucket not in results_by_bucket:
-                results_by_bucket[bucket] = result
-            else:
-                results_by_bucket[bucket] = self._select_better_result(
-                    results_by_bucket[bucket], result
-                )
-
-        # Convert to list format for easy rendering
-        result_list: list[CheckResult | None] = []
-        for bucket_num in range(start_bucket, end_bucket):
-            result_list.append(results_by_bucket.get(bucket_num))
-
-        # Ensure the list is exactly num_buckets long by padding with None on the left
-        # This happens when we're early in monitoring (current_bucket < num_buckets - 1)
-        # Use efficient list concatenation instead of repeated inserts
-        if len(result_list) < num_buckets:
-            padding_needed = num_buckets - len(result_list)
-            result_list = [None] * padding_needed + result_list
+            if first_bucket < start_bucket:
+                closed.add(key)
+                open_checks -= 1
+                if not open_checks:
+                    break
 
         return result_list
 
@@ -235,23 +330,40 @@ class EndpointResultHistory:
         Returns:
             The most recent result of that type, or None if none found
         """
-        for result in reversed(self.results):
-            if result.check_type == check_type:
-                return result
-        return None
+        return self._latest_by_type[check_type]
 
-    def get_all_results(self, check_type: "CheckType | None" = None) -> list["CheckResult"]:
+    def get_all_results(self, check_type: "CheckType | None" = None) -> tuple["CheckResult", ...]:
         """Get all results, optionally filtered by check type.
 
         Args:
             check_type: If provided, only return results of this type
 
         Returns:
-            List of check results
+            Tuple of the stored check results, oldest first - the results themselves
+            are the live objects, a coalesced run still updates its repeat count
+            and last timestamp in place
         """
         if check_type is None:
-            return list(self.results)
-        return [r for r in self.results if r.check_type == check_type]
+            return tuple(self.results)
+        return tuple(r for r in self.results if r.check_type == check_type)
+
+    def _get_bucket_span(self, result: "CheckResult") -> tuple[int, int]:
+        """Get the first and last time bucket covered by a result.
+
+        Args:
+            result: The check result (start_timestamp must be set)
+
+        Returns:
+            Tuple of (first_bucket, last_bucket); equal unless the result
+            represents coalesced repeated failures
+        """
+        first_bucket = int((result.unix_timestamp - self.start_timestamp) / self.interval_seconds)
+        if result.last_timestamp is None:
+            return first_bucket, first_bucket
+        last_bucket = int(
+            (result.last_timestamp.timestamp() - self.start_timestamp) / self.interval_seconds
+        )
+        return first_bucket, last_bucket
 
     def _select_better_result(
         self, current: "CheckResult", candidate: "CheckResult"
@@ -269,17 +381,14 @@ class EndpointResultHistory:
         Returns:
             The better result
         """
-        current_priority = self._priority_order.get(current.check_type, 999)
-        candidate_priority = self._priority_order.get(candidate.check_type, 999)
-
         # Prefer successful results over failures
         if candidate.success and not current.success:
             return candidate
         if not candidate.success and current.success:
             return current
 
-        # Among same success state, prefer higher priority (lower number)
-        if candidate_priority < current_priority:
+        # Among same success state, prefer higher priority (CheckType value is the priority)
+        if candidate.check_type > current.check_type:
             return candidate
 
         return current
@@ -295,9 +404,12 @@ class EndpointType(str, Enum):
     HTTP = "http"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
-    """Result of a single connectivity check."""
+    """Result of a single connectivity check.
+
+    Slotted - one is created per check per iteration, so it is kept compact.
+    """
 
     timestamp: datetime
     check_type: CheckType
@@ -307,6 +419,10 @@ class CheckResult:
     port: int | None = None  # For TCP checks
     protocol: str | None = None  # For HTTP checks (http/https)
     resolved_ip: str | None = None  # For DNS checks - first resolved IP address
+    repeat_count: int = 1  # Number of identical consecutive failures this result stands for
+    last_timestamp: datetime | None = None  # Timestamp of the last repeat (if repeat_count > 1)
+    # POSIX time of timestamp, converted once here instead of on every bucketing pass
+    unix_timestamp: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate the check result.
@@ -319,6 +435,7 @@ class CheckResult:
             raise ValueError("Successful check must have latency")
         if not self.success and self.error_message is None:
             raise ValueError("Failed check must have error message")
+        self.unix_timestamp = self.timestamp.timestamp()
 
 
 @dataclass
@@ -417,7 +534,7 @@ class IPEndpoint(Endpoint):
 
     def get_primary_check_type(self) -> CheckType:
         """Return the primary check type to display in graph/latency."""
-        return self.primary_check_type if self.primary_check_type else CheckType.ICMP
+        return self.primary_check_type if self.primary_check_type is not None else CheckType.ICMP
 
 
 @dataclass
@@ -447,7 +564,7 @@ class IPPortEndpoint(Endpoint):
 
     def get_primary_check_type(self) -> CheckType:
         """Return the primary check type to display in graph/latency."""
-        return self.primary_check_type if self.primary_check_type else CheckType.TCP
+        return self.primary_check_type if self.primary_check_type is not None else CheckType.TCP
 
 
 @dataclass
@@ -478,7 +595,7 @@ class UDPPortEndpoint(Endpoint):
 
     def get_primary_check_type(self) -> CheckType:
         """Return the primary check type to display in graph/latency."""
-        return self.primary_check_type if self.primary_check_type else CheckType.UDP
+        return self.primary_check_type if self.primary_check_type is not None else CheckType.UDP
 
 
 @dataclass
@@ -517,7 +634,7 @@ class DomainEndpoint(Endpoint):
         since port specification implies interest in TCP connectivity.
         For domains without explicit port, returns ICMP for direct connectivity.
         """
-        if self.primary_check_type:
+        if self.primary_check_type is not None:
             return self.primary_check_type
         # If port was explicitly specified, use TCP as primary
         if self.port_specified:
@@ -570,7 +687,7 @@ class HTTPEndpoint(Endpoint):
 
     def get_primary_check_type(self) -> CheckType:
         """Return the primary check type to display in graph/latency."""
-        return self.primary_check_type if self.primary_check_type else CheckType.HTTP
+        return self.primary_check_type if self.primary_check_type is not None else CheckType.HTTP
 
 
 def _is_ip_address(s: str) -> bool:
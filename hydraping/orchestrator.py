@@ -1,8 +1,11 @@
 """Async orchestration of all connectivity checks."""
 
 import asyncio
+import logging
 import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+from functools import partial
 
 from hydraping.checkers.dns import DNSChecker
 from hydraping.checkers.http import HTTPChecker
@@ -21,13 +24,42 @@ from hydraping.models import (
     IPEndpoint,
     IPPortEndpoint,
     UDPPortEndpoint,
+    _is_ip_address,
 )
 
+logger = logging.getLogger(__name__)
+
+# Checks to run for an endpoint: stages run in order, checks within a stage run concurrently
+CheckPlan = tuple[tuple[Callable[[datetime], Awaitable[None]], ...], ...]
+
 # Default maximum expected graph width for history buffer sizing
 # This is used as a fallback if graph_width is not explicitly set
 DEFAULT_MAX_GRAPH_WIDTH = 300
 
 
+# Eager tasks run synchronously until their first real suspension, so checks
+# that complete without blocking skip a round-trip through the event loop
+# (asyncio.eager_task_factory is only available on Python 3.12+)
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a wakeup future unless it was cancelled in the meantime."""
+    if not future.done():
+        future.set_result(None)
+
+
+def _create_check_task(loop: asyncio.AbstractEventLoop, coro: Awaitable[None]) -> asyncio.Task:
+    """Create a task for a check, started eagerly where supported.
+
+    Only check tasks are started eagerly - the loop's task factory is left alone,
+    so other tasks sharing the loop (e.g. the dashboard) keep the default semantics.
+    """
+    if _eager_task_factory is not None:
+        return _eager_task_factory(loop, coro)
+    return loop.create_task(coro)
+
+
 class CheckOrchestrator:
     """Orchestrates all connectivity checks for configured endpoints."""
 
@@ -55,25 +87,54 @@ class CheckOrchestrator:
             success_status_max=config.checks.http_success_status_max,
         )
 
+        # Bound the number of checks doing network I/O at once (open sockets/FDs)
+        self._gate = asyncio.Semaphore(config.checks.max_concurrent_checks)
+
+        # Precompute which checks to run for each endpoint
+        # Plans are rebuilt without ICMP checks once ICMP turns out to be unavailable
+        self._icmp_available = self.icmp_checker.is_available()
+        self._plans = self._build_check_plans()
+
         # Store results history per endpoint using EndpointResultHistory
         # Each history manages time bucketing, priority selection, and check hierarchy
         # Capacity calculation:
         #   graph_width: Number of buckets displayed in graph
         #   * 4: Max check types per endpoint (DNS, ICMP, TCP, HTTP)
         #   * 2: Safety margin for concurrent checks and bucket overlap
-        # The deque will automatically drop oldest results when capacity is reached
+        # The ring buffer will automatically drop oldest results when capacity is reached
         effective_width = graph_width if graph_width is not None else DEFAULT_MAX_GRAPH_WIDTH
         self.history_capacity = effective_width * 4 * 2
-        self.history: dict[str, EndpointResultHistory] = {}
+        # Keyed by id(endpoint): endpoints live as long as the orchestrator, integer keys
+        # hash cheaply, and endpoints sharing the same URL (e.g. different ip_version)
+        # keep separate histories
+        # Histories are created up front since the endpoint set is fixed
+        self.history: dict[int, EndpointResultHistory] = {
+            id(endpoint): EndpointResultHistory(
+                interval_seconds=config.checks.interval_seconds,
+                max_capacity=self.history_capacity,
+                primary_check_type=endpoint.get_primary_check_type(),
+            )
+            for endpoint in self.endpoints
+        }
 
         # Shared time references for all endpoints (set when orchestrator starts)
         # This ensures all endpoints use the same bucket numbering
         self.start_time: float | None = None  # Monotonic time for bucket calculation
         self.start_timestamp: float | None = None  # Wall-clock time for result bucketing
 
+        # Check results waiting to be written to history by the writer task
+        self._pending_results: asyncio.Queue[tuple[EndpointResultHistory, CheckResult]] = (
+            asyncio.Queue()
+        )
+        # Bound once, every check result goes through it
+        self._enqueue_result = self._pending_results.put_nowait
+        # Set whenever new results were written to history (cleared by consumers)
+        self.results_changed = asyncio.Event()
+
         # Control flags
         self._running = False
         self._task: asyncio.Task | None = None
+        self._writer_task: asyncio.Task | None = None
 
     async def start(self):
         """Start the orchestration loop."""
@@ -81,149 +142,287 @@ class CheckOrchestrator:
             return
 
         self._running = True
+        self._writer_task = asyncio.create_task(self._write_results())
         self._task = asyncio.create_task(self._run_loop())
 
     async def stop(self):
         """Stop the orchestration loop."""
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._writer_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _write_results(self):
+        """Write queued check results to history.
+
+        This is the only writer of endpoint histories. Each wakeup applies every
+        result queued so far as one batch. A result that fails to be stored is
+        logged and skipped, so the writer never dies and drops all later results.
+        """
+        pending = self._pending_results
+        while True:
+            batch = [await pending.get()]
+            while not pending.empty():
+                batch.append(pending.get_nowait())
+            for history, result in batch:
+                try:
+                    history.add_result(result)
+                except Exception:
+                    logger.exception("Failed to store %s check result", result.check_type.name)
+            self.results_changed.set()
 
     async def _run_loop(self):
         """Main loop that runs checks at configured interval."""
-        interval = self.config.checks.interval_seconds
+        # Integer nanoseconds keep the schedule aligned without float drift on long runs
+        interval_ns = round(self.config.checks.interval_seconds * 1_000_000_000)
 
         # Set shared start times for all endpoints
-        self.start_time = time.monotonic()
+        start_ns = time.monotonic_ns()
+        self.start_time = start_ns / 1_000_000_000
         self.start_timestamp = time.time()
-        start_time = self.start_time  # Local variable for loop timing
+        for history in self.history.values():
+            history.start_time = self.start_time
+            history.start_timestamp = self.start_timestamp
 
-        iteration = 0
+        # When the next check should start (aligned to interval)
+        next_ns = start_ns
+        loop = asyncio.get_running_loop()
 
         while self._running:
-            # Calculate when this check should start (aligned to interval)
-            target_time = start_time + (iteration * interval)
-            now = time.monotonic()
-
-            # If we're behind schedule, start immediately
-            if now < target_time:
-                await asyncio.sleep(target_time - now)
+            # Wait on a single timer instead of asyncio.sleep()'s extra wrapping
+            delay_ns = next_ns - time.monotonic_ns()
+            if delay_ns > 0:
+                wakeup = loop.create_future()
+                timer = loop.call_at(loop.time() + delay_ns / 1_000_000_000, _wake, wakeup)
+                try:
+                    await wakeup
+                finally:
+                    timer.cancel()
+            else:
+                # Behind schedule - start immediately, but still let other tasks run
+                await asyncio.sleep(0)
+                # Skip iterations missed entirely instead of replaying them in a burst,
+                # staying on the same interval grid
+                next_ns += (-delay_ns // interval_ns) * interval_ns
+            next_ns += interval_ns
+
+            # Stop scheduling ICMP checks once they are known to fail on permissions
+            if self._icmp_available and not self.icmp_checker.is_available():
+                self._icmp_available = False
+                self._plans = self._build_check_plans()
 
             # Capture iteration timestamp once for all checks
             # This ensures all results from this iteration land in the same bucket
+            # Read the wall clock rather than deriving it from the monotonic start time:
+            # the monotonic clock stops while the system is suspended, so derived
+            # timestamps would fall behind the wall-clock buckets the UI renders
             iteration_timestamp = datetime.now()
 
             # Run checks for all endpoints concurrently
-            tasks = [
-                self._check_endpoint(endpoint, iteration_timestamp) for endpoint in self.endpoints
-            ]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # Results reach the history through _store_result as each check finishes,
+            # so there is nothing to collect here - just wait for all of them
+            tasks = []
+            for plan in self._plans.values():
+                if len(plan) == 1:
+                    # A single stage has no ordering to keep - schedule its checks directly
+                    tasks.extend(
+                        _create_check_task(loop, check(iteration_timestamp)) for check in plan[0]
+                    )
+                elif plan:
+                    tasks.append(
+                        _create_check_task(loop, self._run_plan(plan, iteration_timestamp))
+                    )
+            if tasks:
+                try:
+                    done, _ = await asyncio.wait(tasks)
+                except asyncio.CancelledError:
+                    # Stopping - don't leave checks running behind the loop
+                    for task in tasks:
+                        task.cancel()
+                    raise
+                for task in done:
+                    # Checks store their own failures - consume anything unexpected so
+                    # one endpoint never stops the loop or gets logged over the UI
+                    if not task.cancelled():
+                        task.exception()
+
+    def _build_check_plans(self) -> dict[int, CheckPlan]:
+        """Build check plans for all endpoints."""
+        return {id(endpoint): self._build_check_plan(endpoint) for endpoint in self.endpoints}
+
+    def _build_check_plan(self, endpoint: Endpoint) -> CheckPlan:
+        """Build the check plan for an endpoint.
+
+        A plan is a sequence of stages run one after another; the checks within
+        a stage run concurrently. Each check is a callable taking the iteration
+        timestamp, so no per-iteration dispatch on the endpoint type is needed.
+
+        ICMP checks are left out once ICMP is known to be unavailable.
 
-            iteration += 1
+        Args:
+            endpoint: The endpoint to build the plan for
 
-    async def _check_endpoint(self, endpoint: Endpoint, iteration_timestamp: datetime):
-        """Run all applicable checks for a single endpoint."""
-        # Determine which checks to run based on endpoint type
-        check_tasks = []
+        Returns:
+            Tuple of non-empty stages, each a tuple of check callables
+        """
+        stages: list[list[Callable[[datetime], Awaitable[None]]]] = []
 
         if isinstance(endpoint, IPEndpoint):
-            check_tasks.append(self._check_icmp(endpoint, endpoint.ip, iteration_timestamp))
+            stages.append([partial(self._check_icmp, endpoint, endpoint.ip)])
 
         elif isinstance(endpoint, IPPortEndpoint):
-            check_tasks.append(self._check_icmp(endpoint, endpoint.ip, iteration_timestamp))
-            check_tasks.append(
-                self._check_tcp(endpoint, endpoint.ip, endpoint.port, iteration_timestamp)
+            stages.append(
+                [
+                    partial(self._check_icmp, endpoint, endpoint.ip),
+                    partial(self._check_tcp, endpoint, endpoint.ip, endpoint.port),
+                ]
             )
 
         elif isinstance(endpoint, UDPPortEndpoint):
-            check_tasks.append(self._check_icmp(endpoint, endpoint.ip, iteration_timestamp))
-            check_tasks.append(
-                self._check_udp(endpoint, endpoint.ip, endpoint.port, iteration_timestamp)
+            stages.append(
+                [
+                    partial(self._check_icmp, endpoint, endpoint.ip),
+                    partial(self._check_udp, endpoint, endpoint.ip, endpoint.port),
+                ]
             )
 
         elif isinstance(endpoint, DomainEndpoint):
             # For domain: DNS first, then ICMP using resolved IP if available
-            await self._check_dns(
-                endpoint, endpoint.domain, iteration_timestamp, endpoint.ip_version
+            stages.append(
+                [
+                    partial(
+                        self._check_dns, endpoint, endpoint.domain, ip_version=endpoint.ip_version
+                    )
+                ]
             )
 
             # ICMP check will query dns_checker for last resolved IP
-            check_tasks.append(self._check_icmp(endpoint, endpoint.domain, iteration_timestamp))
+            checks = [partial(self._check_icmp, endpoint, endpoint.domain, resolve=True)]
 
             # TCP checks can run in parallel with ICMP
             # If port was explicitly specified, only check that port
             # Otherwise check common ports 80 and 443
-            if endpoint.port_specified:
-                # Explicit port specified - only check that port
-                check_tasks.append(
-                    self._check_tcp(endpoint, endpoint.domain, endpoint.port, iteration_timestamp)
+            ports = [endpoint.port] if endpoint.port_specified else [80, 443]  # HTTP/HTTPS
+            for port in ports:
+                checks.append(
+                    partial(self._check_tcp, endpoint, endpoint.domain, port, resolve=True)
                 )
-            else:
-                # No explicit port - check common HTTP/HTTPS ports
-                check_tasks.append(
-                    self._check_tcp(endpoint, endpoint.domain, 80, iteration_timestamp)
-                )  # HTTP
-                check_tasks.append(
-                    self._check_tcp(endpoint, endpoint.domain, 443, iteration_timestamp)
-                )  # HTTPS
+            stages.append(checks)
 
         elif isinstance(endpoint, HTTPEndpoint):
             # For HTTP endpoint: DNS first, then ICMP using resolved IP if available
-            await self._check_dns(endpoint, endpoint.host, iteration_timestamp, endpoint.ip_version)
-
-            # ICMP check will query dns_checker for last resolved IP
-            check_tasks.append(self._check_icmp(endpoint, endpoint.host, iteration_timestamp))
+            stages.append(
+                [partial(self._check_dns, endpoint, endpoint.host, ip_version=endpoint.ip_version)]
+            )
 
             # TCP and HTTP checks can run in parallel with ICMP
-            check_tasks.append(
-                self._check_tcp(endpoint, endpoint.host, endpoint.port, iteration_timestamp)
+            # Hosts given as IP literals have nothing to substitute
+            resolve = not _is_ip_address(endpoint.host)
+            stages.append(
+                [
+                    partial(self._check_icmp, endpoint, endpoint.host, resolve=resolve),
+                    partial(
+                        self._check_tcp, endpoint, endpoint.host, endpoint.port, resolve=resolve
+                    ),
+                    partial(self._check_http, endpoint, endpoint.url, resolve=resolve),
+                ]
             )
-            check_tasks.append(self._check_http(endpoint, endpoint.url, iteration_timestamp))
 
-        # Run remaining checks concurrently
-        if check_tasks:
-            await asyncio.gather(*check_tasks, return_exceptions=True)
+        if not self._icmp_available:
+            stages = [
+                [check for check in stage if check.func != self._check_icmp] for stage in stages
+            ]
+
+        return tuple(tuple(stage) for stage in stages if stage)
 
-    async def _check_icmp(
+    async def _run_plan(self, plan: CheckPlan, iteration_timestamp: datetime):
+        """Run the stages of an endpoint's check plan one after another."""
+        for stage in plan:
+            # Run the checks of this stage concurrently
+            # Every check stores its own result (including unexpected errors), so the
+            # group never cancels sibling checks because one of them failed
+            async with asyncio.TaskGroup() as tg:
+                for check in stage:
+                    tg.create_task(check(iteration_timestamp))
+
+    def _get_resolved_target(self, hostname: str, ip_version: int | None) -> str:
+        """Get the address to check for a hostname.
+
+        Hostnames are replaced by the IP cached by the DNS check that ran
+        earlier in the iteration, so the other checks don't resolve them again.
+        When that DNS check failed, nothing is cached and the hostname is kept.
+
+        Args:
+            hostname: Target hostname
+            ip_version: IP version preference the hostname was resolved with
+
+        Returns:
+            The resolved IP, or the hostname itself if the last resolution failed
+        """
+        return self.dns_checker.get_last_resolved_ip(hostname, ip_version) or hostname
+
+    async def _run_and_store(
         self,
         endpoint: Endpoint,
-        target: str,
+        check: Awaitable[CheckResult],
         iteration_timestamp: datetime,
+        check_type: CheckType,
+        port: int | None = None,
     ):
-        """Run ICMP check and store result.
+        """Await a checker call and store its result.
 
-        For domain endpoints, will attempt to use the last resolved IP from DNS checker
-        to avoid duplicate DNS lookups and align with the check hierarchy.
+        Defensive: ensures a result is always stored, even on unexpected errors.
 
         Args:
             endpoint: The endpoint being checked
-            target: Target hostname or IP to ping
+            check: The checker coroutine to await
             iteration_timestamp: Timestamp for this check iteration
+            check_type: Type of the check (for the unexpected error result)
+            port: Port of the check (for the unexpected error result)
         """
         try:
-            # Only query DNS checker for resolved IP if target is not already an IP
-            from hydraping.models import _is_ip_address
-
-            icmp_target = target
-            if not _is_ip_address(target):
-                # Target is a domain name, try to use cached resolved IP
-                icmp_target = self.dns_checker.get_last_resolved_ip(target) or target
-
-            result = await self.icmp_checker.check(icmp_target, iteration_timestamp)
-            self._store_result(endpoint, result)
+            async with self._gate:
+                result = await check
         except Exception as e:
-            # Defensive: ensure we always store a result, even on unexpected errors
             result = CheckResult(
                 timestamp=iteration_timestamp,
-                check_type=CheckType.ICMP,
+                check_type=check_type,
                 success=False,
                 error_message=f"Unexpected error: {e}",
+                port=port,
             )
-            self._store_result(endpoint, result)
+        self._store_result(endpoint, result)
+
+    async def _check_icmp(
+        self,
+        endpoint: Endpoint,
+        target: str,
+        iteration_timestamp: datetime,
+        resolve: bool = False,
+    ):
+        """Run ICMP check and store result.
+
+        For domain endpoints, will attempt to use the last resolved IP from DNS checker
+        to avoid duplicate DNS lookups and align with the check hierarchy.
+
+        Args:
+            endpoint: The endpoint being checked
+            target: Target hostname or IP to ping
+            iteration_timestamp: Timestamp for this check iteration
+            resolve: Whether target is a hostname to replace by the resolved IP
+        """
+        if resolve:
+            target = self._get_resolved_target(target, endpoint.ip_version)
+        await self._run_and_store(
+            endpoint,
+            self.icmp_checker.check(target, iteration_timestamp),
+            iteration_timestamp,
+            CheckType.ICMP,
+        )
 
     async def _check_dns(
         self,
@@ -235,133 +434,110 @@ class CheckOrchestrator:
         """Run DNS check and store result.
 
         The DNS checker will cache the resolved IP internally, which can be
-        queried by ICMP checks to avoid duplicate DNS lookups.
+        queried by ICMP, TCP and HTTP checks to avoid duplicate DNS lookups.
         """
-        try:
-            result = await self.dns_checker.check(target, iteration_timestamp, ip_version)
-            self._store_result(endpoint, result)
-        except Exception as e:
-            # Defensive: ensure we always store a result, even on unexpected errors
-            result = CheckResult(
-                timestamp=iteration_timestamp,
-                check_type=CheckType.DNS,
-                success=False,
-                error_message=f"Unexpected error: {e}",
-            )
-            self._store_result(endpoint, result)
+        await self._run_and_store(
+            endpoint,
+            self.dns_checker.check(target, iteration_timestamp, ip_version),
+            iteration_timestamp,
+            CheckType.DNS,
+        )
 
     async def _check_tcp(
-        self, endpoint: Endpoint, host: str, port: int, iteration_timestamp: datetime
+        self,
+        endpoint: Endpoint,
+        host: str,
+        port: int,
+        iteration_timestamp: datetime,
+        resolve: bool = False,
     ):
-        """Run TCP check and store result."""
-        try:
-            result = await self.tcp_checker.check(host, port, iteration_timestamp)
-            self._store_result(endpoint, result)
-        except Exception as e:
-            # Defensive: ensure we always store a result, even on unexpected errors
-            result = CheckResult(
-                timestamp=iteration_timestamp,
-                check_type=CheckType.TCP,
-                success=False,
-                error_message=f"Unexpected error: {e}",
-                port=port,
-            )
-            self._store_result(endpoint, result)
+        """Run TCP check and store result.
+
+        With resolve set, the host name is connected to via the IP resolved by the DNS check.
+        """
+        if resolve:
+            host = self._get_resolved_target(host, endpoint.ip_version)
+        await self._run_and_store(
+            endpoint,
+            self.tcp_checker.check(host, port, iteration_timestamp),
+            iteration_timestamp,
+            CheckType.TCP,
+            port,
+        )
 
     async def _check_udp(
         self, endpoint: Endpoint, host: str, port: int, iteration_timestamp: datetime
     ):
         """Run UDP check and store result."""
-        try:
-            # Extract probe_data if this is a UDPPortEndpoint
-            probe_data = b""
-            if isinstance(endpoint, UDPPortEndpoint):
-                probe_data = endpoint.probe_data
+        # Extract probe_data if this is a UDPPortEndpoint
+        probe_data = b""
+        if isinstance(endpoint, UDPPortEndpoint):
+            probe_data = endpoint.probe_data
+
+        await self._run_and_store(
+            endpoint,
+            self.udp_checker.check(host, port, iteration_timestamp, probe_data),
+            iteration_timestamp,
+            CheckType.UDP,
+            port,
+        )
 
-            result = await self.udp_checker.check(host, port, iteration_timestamp, probe_data)
-            self._store_result(endpoint, result)
-        except Exception as e:
-            # Defensive: ensure we always store a result, even on unexpected errors
-            result = CheckResult(
-                timestamp=iteration_timestamp,
-                check_type=CheckType.UDP,
-                success=False,
-                error_message=f"Unexpected error: {e}",
-                port=port,
-            )
-            self._store_result(endpoint, result)
+    async def _check_http(
+        self, endpoint: Endpoint, url: str, iteration_timestamp: datetime, resolve: bool = False
+    ):
+        """Run HTTP check and store result.
 
-    async def _check_http(self, endpoint: Endpoint, url: str, iteration_timestamp: datetime):
-        """Run HTTP check and store result."""
-        try:
-            result = await self.http_checker.check(url, iteration_timestamp)
-            self._store_result(endpoint, result)
-        except Exception as e:
-            # Defensive: ensure we always store a result, even on unexpected errors
-            result = CheckResult(
-                timestamp=iteration_timestamp,
-                check_type=CheckType.HTTP,
-                success=False,
-                error_message=f"Unexpected error: {e}",
-            )
-            self._store_result(endpoint, result)
+        With resolve set, the request connects to the IP resolved by the DNS check
+        while keeping the original URL, so the Host header and TLS SNI are unchanged.
+        """
+        resolved_ip = None
+        if resolve and isinstance(endpoint, HTTPEndpoint):
+            resolved_ip = self.dns_checker.get_last_resolved_ip(endpoint.host, endpoint.ip_version)
+
+        await self._run_and_store(
+            endpoint,
+            self.http_checker.check(url, iteration_timestamp, resolved_ip),
+            iteration_timestamp,
+            CheckType.HTTP,
+        )
 
     def _store_result(self, endpoint: Endpoint, result: CheckResult):
-        """Store result in history."""
-        # Get or create history for this endpoint
-        if endpoint.raw not in self.history:
-            self.history[endpoint.raw] = EndpointResultHistory(
-                interval_seconds=self.config.checks.interval_seconds,
-                max_capacity=self.history_capacity,
-                start_time=self.start_time,
-                start_timestamp=self.start_timestamp,
-                primary_check_type=endpoint.get_primary_check_type(),
-            )
-        self.history[endpoint.raw].add_result(result)
+        """Queue result to be stored in history by the writer task."""
+        self._enqueue_result((self.history[id(endpoint)], result))
 
     def get_latest_result(self, endpoint: Endpoint, check_type: CheckType) -> CheckResult | None:
         """Get the most recent result for an endpoint and check type."""
-        history = self.history.get(endpoint.raw)
-        if history is None:
-            return None
-        return history.get_latest_by_type(check_type)
+        return self.history[id(endpoint)].get_latest_by_type(check_type)
 
-    def get_history(self, endpoint: Endpoint) -> EndpointResultHistory | None:
+    def get_history(self, endpoint: Endpoint) -> EndpointResultHistory:
         """Get result history object for an endpoint.
 
         Returns:
-            EndpointResultHistory for the endpoint, or None if no history yet
+            EndpointResultHistory for the endpoint
         """
-        return self.history.get(endpoint.raw)
+        return self.history[id(endpoint)]
 
     def get_problems(self, endpoint: Endpoint) -> list[str]:
         """Get list of current problems for an endpoint."""
         problems = []
+        history = self.history[id(endpoint)]
+
+        icmp_available = self.icmp_checker.is_available()
 
         # Check hierarchy: HTTP > TCP > DNS > ICMP
-        # If a higher-level check succeeds, suppress lower-level failures
-        check_hierarchy = CHECK_TYPE_PRIORITY
-
-        # Find the highest successful check level
-        highest_success_level = -1
-        for i, check_type in enumerate(check_hierarchy):
-            result = self.get_latest_result(endpoint, check_type)
-            if result and result.success:
-                highest_success_level = i
+        # Walk from the highest level down; once a check succeeds, all lower-level
+        # failures are suppressed, so the scan can stop there
+        for check_type in CHECK_TYPE_PRIORITY:
+            result = history.get_latest_by_type(check_type)
+            if result is None:
+                continue
+            if result.success:
                 break
 
-        # Only report failures for checks at or above the highest success level
-        for i, check_type in enumerate(check_hierarchy):
-            result = self.get_latest_result(endpoint, check_type)
-            if result and not result.success:
-                # Skip ICMP unavailable errors (system-wide permission issues)
-                if check_type == CheckType.ICMP and not self.icmp_checker.is_available():
-                    continue
-
-                # Skip lower-level failures if a higher-level check succeeded
-                if highest_success_level >= 0 and i > highest_success_level:
-                    continue
+            # Skip ICMP unavailable errors (system-wide permission issues)
+            if check_type is CheckType.ICMP and not icmp_available:
+                continue
 
-                problems.append(f"{check_type.value.upper()}: {result.error_message}")
+            problems.append(f"{check_type.name}: {result.error_message}")
 
         return problems
@@ -1,5 +1,7 @@
 """UI constants and color thresholds for latency display."""
 
+from bisect import bisect_right
+
 # Latency thresholds in milliseconds for color coding
 LATENCY_GREEN_MAX = 50.0  # Below this: green (good)
 LATENCY_YELLOW_MAX = 100.0  # Below this: yellow (medium)
@@ -14,6 +16,24 @@ if not (0 < LATENCY_GREEN_MAX < LATENCY_YELLOW_MAX < LATENCY_ORANGE_MAX):
     )
 
 
+# Latency colors ordered from best to worst, indexed by latency level
+LATENCY_THRESHOLDS = (LATENCY_GREEN_MAX, LATENCY_YELLOW_MAX, LATENCY_ORANGE_MAX)
+LATENCY_COLORS = ("green", "yellow", "orange1", "red")
+
+
+def get_latency_level(latency_ms: float) -> int:
+    """Get the severity level of a latency value.
+
+    Args:
+        latency_ms: Latency in milliseconds
+
+    Returns:
+        Number of thresholds the latency has reached (0 = green ... 3 = red)
+    """
+    # bisect_right so a latency equal to a threshold already gets the next level
+    return bisect_right(LATENCY_THRESHOLDS, latency_ms)
+
+
 def get_latency_color(latency_ms: float) -> str:
     """Get color for latency value based on thresholds.
 
@@ -23,11 +43,4 @@ def get_latency_color(latency_ms: float) -> str:
     Returns:
         Color name for Rich styling
     """
-    if latency_ms < LATENCY_GREEN_MAX:
-        return "green"
-    elif latency_ms < LATENCY_YELLOW_MAX:
-        return "yellow"
-    elif latency_ms < LATENCY_ORANGE_MAX:
-        return "orange1"
-    else:
-        return "red"
+    return LATENCY_COLORS[get_latency_level(latency_ms)]
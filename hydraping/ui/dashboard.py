@@ -1,18 +1,89 @@
 """Main terminal UI dashboard for HydraPing."""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from rich.console import Console, Group
 from rich.live import Live
-from rich.table import Table
+from rich.style import Style
 from rich.text import Text
 
-from hydraping.models import CheckType, Endpoint
+from hydraping.models import CheckType, Endpoint, EndpointResultHistory
 from hydraping.orchestrator import CheckOrchestrator
 from hydraping.ui.constants import get_latency_color
 from hydraping.ui.graph import LatencyGraph
 
+# Styles used by the dashboard, parsed once instead of from strings on every frame
+_STYLES: dict[str, Style] = {
+    name: Style.parse(name)
+    for name in ("bold", "dim", "red", "bold red", "green", "yellow", "orange1")
+}
+
+
+# Fixed lines of the problems section
+_EMPTY_LINE = Text()
+_PROBLEMS_HEADER = Text("Problems:", style=_STYLES["bold red"])
+_ICMP_UNAVAILABLE_LINE = Text(
+    "  • ICMP unavailable (no permissions) - ping checks disabled", style=_STYLES["red"]
+)
+
+# Space between columns, and before the first and after the last column
+_CELL_PADDING = 1
+
+
+def _make_cell(text: str, style: Style, width: int, justify: str = "left") -> Text:
+    """Make a styled cell of exactly the given width.
+
+    Longer text is cut with an ellipsis, shorter text is padded with unstyled spaces.
+    """
+    cell = Text(text, overflow="ellipsis")
+    cell.stylize(style)
+    cell.align(justify, width)
+    return cell
+
+
+@lru_cache(maxsize=256)
+def _get_check_label(
+    check_type: CheckType, port: int | None = None, protocol: str | None = None
+) -> str:
+    """Get the check label shown next to the latency, e.g. "(TCP:443)" or "(HTTPS)"."""
+    if check_type is CheckType.TCP and port:
+        return f"(TCP:{port})"
+    if check_type is CheckType.HTTP and protocol:
+        return f"({protocol.upper()})"
+    return f"({check_type.name})"
+
+
+@lru_cache(maxsize=128)
+def _get_label_cell(text: str, style_name: str, width: int, justify: str = "left") -> Text:
+    """Get a cell for a fixed label, shared between rows and frames.
+
+    Only a few labels exist (e.g. "N/A", "FAIL", "(TCP:443)"), so they are built once.
+    """
+    return _make_cell(text, _STYLES[style_name], width, justify)
+
+
+def calculate_endpoint_width(endpoints: list[Endpoint]) -> int:
+    """Calculate the endpoint column width from the endpoint names.
+
+    Args:
+        endpoints: List of endpoints to display
+
+    Returns:
+        Endpoint column width in characters
+    """
+    # Longest endpoint name + padding
+    endpoint_width = max(len(ep.display_name) for ep in endpoints) + 2
+    return min(endpoint_width, 30)  # Cap at reasonable max
+
 
 def calculate_graph_width(
-    endpoints: list[Endpoint], terminal_width: int, ui_graph_width: int = 0
+    endpoints: list[Endpoint],
+    terminal_width: int,
+    ui_graph_width: int = 0,
+    endpoint_width: int | None = None,
 ) -> int:
     """Calculate graph width based on terminal size and configuration.
 
@@ -20,6 +91,7 @@ def calculate_graph_width(
         endpoints: List of endpoints to display
         terminal_width: Current terminal width in characters
         ui_graph_width: Configured graph width (0 = auto-size)
+        endpoint_width: Precomputed endpoint column width (calculated from endpoints if None)
 
     Returns:
         Calculated graph width in characters
@@ -40,9 +112,8 @@ def calculate_graph_width(
 
     # Calculate auto-sized graph width
     # Endpoint column: longest endpoint name + padding
-    endpoint_names = [ep.display_name for ep in endpoints]
-    endpoint_width = max(len(name) for name in endpoint_names) + 2
-    endpoint_width = min(endpoint_width, 30)  # Cap at reasonable max
+    if endpoint_width is None:
+        endpoint_width = calculate_endpoint_width(endpoints)
 
     # Latency time column: fixed width for "999.9ms" (8 chars)
     latency_time_width = 8
@@ -50,12 +121,12 @@ def calculate_graph_width(
     # Protocol column: fixed width for "(TCP:443)" (10 chars)
     protocol_width = 10
 
-    # Table padding: padding=(0, 1) means 1 space on each side of each cell
+    # Cell padding: 1 space on each side of each cell
     # With 4 columns: 4 columns * 2 sides * 1 space = 8 spaces total
-    table_padding = 8
+    cell_padding = 4 * 2 * _CELL_PADDING
 
     # Graph column: remaining space
-    total_fixed = endpoint_width + latency_time_width + protocol_width + table_padding
+    total_fixed = endpoint_width + latency_time_width + protocol_width + cell_padding
     graph_width = terminal_width - total_fixed
 
     # Ensure minimum width
@@ -65,6 +136,11 @@ def calculate_graph_width(
 class Dashboard:
     """Live-updating terminal dashboard."""
 
+    # Longest time between display updates while no results arrive (keeps the graph scrolling)
+    MAX_UPDATE_INTERVAL_SECONDS = 1.0
+    # Delay after the first new result, so the rest of a burst is rendered with it
+    RESULT_BURST_DELAY_SECONDS = 0.1
+
     def __init__(self, orchestrator: CheckOrchestrator, console: Console | None = None):
         """Initialize dashboard with orchestrator.
 
@@ -76,26 +152,65 @@ class Dashboard:
         self.console = console if console is not None else Console()
 
         # Calculate column widths
+        # Endpoint names don't change, only the graph width depends on the terminal
+        self.endpoint_width = calculate_endpoint_width(orchestrator.endpoints)
+        self._last_console_width: int | None = None
         self._calculate_column_widths()
 
         # Create graph renderers for each endpoint
-        self.graphs: dict[str, LatencyGraph] = {}
+        # Keyed by endpoint identity like the orchestrator's history
+        self.graphs: dict[int, LatencyGraph] = {}
         for endpoint in orchestrator.endpoints:
-            self.graphs[endpoint.raw] = LatencyGraph(width=self.graph_width)
+            self.graphs[id(endpoint)] = LatencyGraph(width=self.graph_width)
+
+        # Resolve everything a row needs once instead of on every render
+        # Rows hold (endpoint, name cell, history, graph) in endpoint order
+        self._rows: list[tuple[Endpoint, Text, EndpointResultHistory, LatencyGraph]] = [
+            (
+                endpoint,
+                _make_cell(endpoint.display_name, _STYLES["bold"], self.endpoint_width),
+                orchestrator.get_history(endpoint),
+                self.graphs[id(endpoint)],
+            )
+            for endpoint in orchestrator.endpoints
+        ]
+
+        # Problem lines are prefixed with the endpoint name, built once as well
+        self._problem_prefixes: list[tuple[Endpoint, str]] = [
+            (endpoint, f"{endpoint.display_name}: ") for endpoint in orchestrator.endpoints
+        ]
+
+        # Rendered problem lines per endpoint with the (ICMP availability, history version)
+        # they were built for - only endpoints whose history moved are asked again
+        self._endpoint_problems: dict[int, tuple[tuple[bool, int], list[Text]]] = {}
+
+        # Rendered rows per endpoint, with the (history version, current bucket)
+        # they were built for - a row only changes when either of them moves
+        self._row_cache: dict[int, tuple[tuple[int, int], Text]] = {}
+
+    def _calculate_column_widths(self) -> bool:
+        """Calculate fixed column widths based on terminal size.
+
+        Nothing is recalculated while the terminal width stays the same.
+
+        Returns:
+            True if the widths were (re)calculated
+
+        Raises:
+            ValueError: If terminal is too narrow
+        """
+        console_width = self.console.width
+        if console_width == self._last_console_width:
+            return False
 
-    def _calculate_column_widths(self):
-        """Calculate fixed column widths based on terminal size."""
         # Use the helper function to calculate graph width
         self.graph_width = calculate_graph_width(
             self.orchestrator.endpoints,
-            self.console.width,
+            console_width,
             self.orchestrator.config.ui.graph_width,
+            self.endpoint_width,
         )
-
-        # Endpoint column: longest endpoint name + padding
-        endpoint_names = [ep.display_name for ep in self.orchestrator.endpoints]
-        self.endpoint_width = max(len(name) for name in endpoint_names) + 2
-        self.endpoint_width = min(self.endpoint_width, 30)  # Cap at reasonable max
+        self._last_console_width = console_width
 
         # Latency time column: fixed width for "999.9ms" (8 chars)
         self.latency_time_width = 8
@@ -103,132 +218,208 @@ class Dashboard:
         # Protocol column: fixed width for "(TCP:443)" (10 chars)
         self.protocol_width = 10
 
+        return True
+
+    def _adapt_to_terminal_width(self):
+        """Resize the graphs if the terminal width changed since the last render."""
+        try:
+            resized = self._calculate_column_widths()
+        except ValueError:
+            # Terminal is too narrow now - keep the current layout until it grows again
+            return
+        if resized:
+            for graph in self.graphs.values():
+                graph.resize(self.graph_width)
+            self._row_cache.clear()
+
     def render(self) -> Group:
         """Render the current state as a Rich group."""
-        table = Table(show_header=False, box=None, padding=(0, 1))
+        self._adapt_to_terminal_width()
 
-        # Add columns with fixed widths
-        table.add_column("Endpoint", width=self.endpoint_width, no_wrap=True)
-        table.add_column("Graph", width=self.graph_width, no_wrap=True)
-        table.add_column("Time", width=self.latency_time_width, justify="right", no_wrap=True)
-        table.add_column("Protocol", width=self.protocol_width, justify="left", no_wrap=True)
+        # Read the clock once per frame, so all rows agree on the current bucket
+        now = time.time()
 
-        # Add rows for each endpoint
-        for endpoint in self.orchestrator.endpoints:
-            self._add_endpoint_row(table, endpoint)
+        # Rows are assembled from fixed-width cells, column widths never change while
+        # running, so there is no need for a table to measure and lay them out
+        renderables: list[Text] = [
+            self._get_endpoint_row(endpoint, name_text, history, graph_renderer, now)
+            for endpoint, name_text, history, graph_renderer in self._rows
+        ]
 
         # Build problems section
-        problems_text = self._render_problems()
-        renderables = [table]
-
-        if problems_text:
-            renderables.append(Text())  # Empty line
-            renderables.append(Text("Problems:", style="bold red"))
-            for problem in problems_text:
-                renderables.append(Text(f"  • {problem}", style="red"))
+        problem_lines = self._render_problems()
+        if problem_lines:
+            renderables.append(_EMPTY_LINE)
+            renderables.append(_PROBLEMS_HEADER)
+            renderables.extend(problem_lines)
 
         return Group(*renderables)
 
-    def _add_endpoint_row(self, table: Table, endpoint: Endpoint):
-        """Add a row for an endpoint to the table."""
-        # Get result history for this endpoint
-        history = self.orchestrator.get_history(endpoint)
-
-        if history is None:
-            # No data yet
-            time_str = "N/A"
+    def _get_endpoint_row(
+        self,
+        endpoint: Endpoint,
+        name_text: Text,
+        history: EndpointResultHistory,
+        graph_renderer: LatencyGraph,
+        now: float,
+    ) -> Text:
+        """Get the row for an endpoint, re-rendering it only when stale."""
+        key = (history.version, history.get_current_bucket(now))
+        cached = self._row_cache.get(id(endpoint))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        row = self._render_endpoint_row(name_text, history, graph_renderer, now)
+        self._row_cache[id(endpoint)] = (key, row)
+        return row
+
+    def _render_endpoint_row(
+        self,
+        name_text: Text,
+        history: EndpointResultHistory,
+        graph_renderer: LatencyGraph,
+        now: float,
+    ) -> Text:
+        """Render the row for an endpoint."""
+        # Get the current result (what should be displayed now)
+        # This is synchronized with what the graph shows
+        latency_result = history.get_current_result(now)
+
+        # Format latency time and protocol separately
+        if latency_result and latency_result.success and latency_result.latency_ms is not None:
+            # Check label with port/protocol info
+            time_text = _make_cell(
+                f"{latency_result.latency_ms:.1f}ms",
+                _STYLES[get_latency_color(latency_result.latency_ms)],
+                self.latency_time_width,
+                "right",
+            )
+            protocol_str = _get_check_label(
+                latency_result.check_type, latency_result.port, latency_result.protocol
+            )
+        elif latency_result and not latency_result.success:
+            time_text = _get_label_cell("FAIL", "red", self.latency_time_width, "right")
+            protocol_str = _get_check_label(latency_result.check_type)
+        else:
+            time_text = _get_label_cell("N/A", "dim", self.latency_time_width, "right")
             protocol_str = ""
-            latency_style = "dim"
-            graph_renderer = self.graphs[endpoint.raw]
-            # Render empty graph (all None)
-            bucketed_results = [None] * graph_renderer.width
+
+        # Get bucketed results and render the graph
+        # History prepares the ready-to-render list, graph just renders it
+        if history.results:
+            bucketed_results = history.get_bucketed_results(graph_renderer.width, now)
             graph_text = graph_renderer.render(bucketed_results)
         else:
-            # Get the current result (what should be displayed now)
-            # This is synchronized with what the graph shows
-            latency_result = history.get_current_result()
-
-            # Format latency time and protocol separately
-            if latency_result and latency_result.success and latency_result.latency_ms is not None:
-                # Build check label with port/protocol info
-                check_label = latency_result.check_type.value.upper()
-                if latency_result.check_type == CheckType.TCP and latency_result.port:
-                    check_label = f"TCP:{latency_result.port}"
-                elif latency_result.check_type == CheckType.HTTP and latency_result.protocol:
-                    check_label = latency_result.protocol.upper()
-
-                time_str = f"{latency_result.latency_ms:.1f}ms"
-                protocol_str = f"({check_label})"
-                latency_style = get_latency_color(latency_result.latency_ms)
-            elif latency_result and not latency_result.success:
-                check_label = latency_result.check_type.value.upper()
-                time_str = "FAIL"
-                protocol_str = f"({check_label})"
-                latency_style = "red"
-            else:
-                time_str = "N/A"
-                protocol_str = ""
-                latency_style = "dim"
-
-            # Get bucketed results and render the graph
-            # History prepares the ready-to-render list, graph just renders it
-            graph_renderer = self.graphs[endpoint.raw]
-            bucketed_results = history.get_bucketed_results(graph_renderer.width)
-            graph_text = graph_renderer.render(bucketed_results)
-
-        # Add row
-        table.add_row(
-            Text(endpoint.display_name, style="bold"),
+            # Not checked yet - nothing to bucket
+            graph_text = graph_renderer.render_empty()
+
+        edge = " " * _CELL_PADDING
+        gap = edge * 2
+        return Text.assemble(
+            edge,
+            name_text,
+            gap,
             graph_text,
-            Text(time_str, style=latency_style),
-            Text(protocol_str, style="dim"),
+            gap,
+            time_text,
+            gap,
+            _get_label_cell(protocol_str, "dim", self.protocol_width),
+            edge,
+            no_wrap=True,
+            overflow="crop",
+        )
+
+    def _get_frame_key(self) -> tuple:
+        """Get a key that changes whenever the rendered dashboard would change."""
+        now = time.time()
+        return (
+            self.console.width,
+            self.orchestrator.icmp_checker.is_available(),
+            *(
+                (history.version, history.get_current_bucket(now))
+                for _, _, history, _ in self._rows
+            ),
         )
 
-    def _render_problems(self) -> list[str]:
-        """Get list of current problems across all endpoints."""
-        problems = []
-        icmp_unavailable_shown = False
+    def _render_problems(self) -> list[Text]:
+        """Render the lines of current problems across all endpoints.
+
+        Problems only depend on the latest results, so each endpoint's lines are
+        reused until ICMP availability or that endpoint's history changes.
+        """
+        icmp_available = self.orchestrator.icmp_checker.is_available()
+
+        lines = []
 
         # Check if ICMP is globally unavailable
-        if not self.orchestrator.icmp_checker.is_available() and not icmp_unavailable_shown:
-            problems.append("ICMP unavailable (no permissions) - ping checks disabled")
-            icmp_unavailable_shown = True
+        if not icmp_available:
+            lines.append(_ICMP_UNAVAILABLE_LINE)
 
         # Add endpoint-specific problems
-        for endpoint in self.orchestrator.endpoints:
-            endpoint_problems = self.orchestrator.get_problems(endpoint)
-            for problem in endpoint_problems:
-                problems.append(f"{endpoint.display_name}: {problem}")
-
-        return problems
+        rows = zip(self._problem_prefixes, self._rows, strict=True)
+        for (endpoint, prefix), (_, _, history, _) in rows:
+            endpoint_key = (icmp_available, history.version)
+            cached = self._endpoint_problems.get(id(endpoint))
+            if cached is None or cached[0] != endpoint_key:
+                endpoint_lines = [
+                    Text(f"  • {prefix}{problem}", style=_STYLES["red"])
+                    for problem in self.orchestrator.get_problems(endpoint)
+                ]
+                cached = (endpoint_key, endpoint_lines)
+                self._endpoint_problems[id(endpoint)] = cached
+            lines.extend(cached[1])
+
+        return lines
 
     async def run(self):
         """Run the live dashboard."""
-        # Set up live display with automatic refresh
+        # Set up live display without automatic refresh
         # We update the display in the main loop to avoid race conditions
-        # from concurrent check results updating simultaneously
+        # from concurrent check results updating simultaneously, and only redraw
+        # when a frame actually changed instead of re-rendering the same one 4x a second
         live = Live(
             self.render(),
             console=self.console,
-            refresh_per_second=4,
+            auto_refresh=False,
             screen=False,
         )
 
         # Start orchestrator and live display
-        live.start()
+        live.start(refresh=True)
         await self.orchestrator.start()
 
-        # Keep running and update display periodically
+        # Keep running and update display as results arrive
+        # The frame is built on the event loop (it reads the histories), but drawing it
+        # to the terminal happens on a worker thread - like rich's own auto-refresh
+        # thread - so laying out and writing a large frame doesn't delay checks
+        loop = asyncio.get_running_loop()
+        refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dashboard")
+        results_changed = self.orchestrator.results_changed
         try:
-            import asyncio
-
+            frame_key = None
             while True:
-                # Update the display with fresh data
-                live.update(self.render())
-                await asyncio.sleep(1.0)  # Update once per second
+                # Update the display with fresh data, unless nothing it shows has changed
+                current_frame_key = self._get_frame_key()
+                if current_frame_key != frame_key:
+                    live.update(self.render())
+                    await loop.run_in_executor(refresh_executor, live.refresh)
+                    frame_key = current_frame_key
+
+                # Wake up on new results, or after the update interval at the latest so the
+                # graph keeps scrolling while nothing arrives
+                try:
+                    await asyncio.wait_for(
+                        results_changed.wait(), timeout=self.MAX_UPDATE_INTERVAL_SECONDS
+                    )
+                except TimeoutError:
+                    continue
+                # Let the rest of a burst of results land before rendering them
+                await asyncio.sleep(self.RESULT_BURST_DELAY_SECONDS)
+                results_changed.clear()
         except KeyboardInterrupt:
             # Suppress KeyboardInterrupt output
             pass
         finally:
             await self.orchestrator.stop()
+            refresh_executor.shutdown(wait=True)
             live.stop()
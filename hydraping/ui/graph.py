@@ -1,29 +1,72 @@
 """Latency graph rendering for terminal UI."""
 
-from rich.text import Text
+from functools import lru_cache
+
+from rich.style import Style
+from rich.text import Span, Text
 
 from hydraping.models import CheckResult
 from hydraping.ui.constants import (
+    LATENCY_COLORS,
     LATENCY_GREEN_MAX,
     LATENCY_ORANGE_MAX,
     LATENCY_YELLOW_MAX,
-    get_latency_color,
+    get_latency_level,
+)
+
+# Start and height of each latency color zone, indexed by latency level
+_ZONE_STARTS = (0.0, LATENCY_GREEN_MAX, LATENCY_YELLOW_MAX, LATENCY_ORANGE_MAX)
+_ZONE_HEIGHTS = (
+    LATENCY_GREEN_MAX,
+    LATENCY_YELLOW_MAX - LATENCY_GREEN_MAX,
+    LATENCY_ORANGE_MAX - LATENCY_YELLOW_MAX,
+    300.0,  # Red zone reaches full height 300ms above its start
 )
 
+# Parsed once, so spans hand rich ready styles instead of names to look up on every render
+_LATENCY_STYLES = tuple(Style.parse(color) for color in LATENCY_COLORS)
+_ERROR_STYLE = Style.parse("red")
+_EMPTY_STYLE = Style.parse("dim")
+
 
 class LatencyGraph:
     """Renders latency history as a graph."""
 
     # Unicode block characters for graph bars (from empty to full)
-    BLOCKS = ["·", "▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
+    BLOCKS = ("·", "▁", "▂", "▃", "▄", "▅", "▆", "▇", "█")
     EMPTY_CHAR = "·"  # Character for empty/padding areas
 
     # Latency thresholds for height calculation (in ms)
     MAX_LATENCY_FOR_GRAPH = 500.0  # Anything above this is max height
 
+    # Maximum gap size to show as errors (exclamation marks)
+    # Larger gaps show as dots to avoid walls of exclamation marks
+    MAX_ERROR_GAP_SIZE = 10
+
     def __init__(self, width: int):
         """Initialize graph with fixed width."""
         self.width = width
+        self._empty_text: Text | None = None
+        # The same results are drawn again on every frame until they scroll out,
+        # so bars are memoized by latency for the lifetime of the graph
+        self._get_cached_bar = lru_cache(maxsize=1024)(self._get_bar_for_latency)
+
+    def resize(self, width: int):
+        """Change the graph width (e.g. after the terminal was resized)."""
+        self.width = width
+        self._empty_text = None
+
+    def render_empty(self) -> Text:
+        """Render a graph with no data yet.
+
+        The result is always the same, so it is rendered once and reused.
+
+        Returns:
+            Text object with an all-empty graph
+        """
+        if self._empty_text is None:
+            self._empty_text = self.render([None] * self.width)
+        return self._empty_text
 
     def render(self, bucketed_results: list[CheckResult | None]) -> Text:
         """Render graph from pre-bucketed check results.
@@ -44,100 +87,71 @@ class LatencyGraph:
         Returns:
             Text object with properly styled graph
         """
-        # Maximum gap size to show as errors (exclamation marks)
-        # Larger gaps show as dots to avoid walls of exclamation marks
-        MAX_ERROR_GAP_SIZE = 10
-
-        # Find the boundaries of actual data to distinguish gaps from empty space
-        first_data_idx = None
-        last_data_idx = None
-        for i, result in enumerate(bucketed_results):
-            if result is not None:
-                if first_data_idx is None:
-                    first_data_idx = i
-                last_data_idx = i
-
-        # Identify gap regions and their sizes
-        # A gap is a contiguous sequence of None values between data points
-        gap_sizes = {}  # Maps index -> size of gap containing that index
-        if first_data_idx is not None and last_data_idx is not None:
-            i = first_data_idx
-            while i <= last_data_idx:
-                if bucketed_results[i] is None:
-                    # Found start of a gap, measure its size
-                    gap_start = i
-                    gap_size = 0
-                    while i <= last_data_idx and bucketed_results[i] is None:
-                        gap_size += 1
-                        i += 1
-                    # Record gap size for all indices in this gap
-                    for j in range(gap_start, gap_start + gap_size):
-                        gap_sizes[j] = gap_size
-                else:
-                    i += 1
-
-        # Build graph with proper styling per character
-        graph_text = Text()
-
-        # Render each position in the list
-        for i, result in enumerate(bucketed_results):
+        # Build graph characters into a list and join them once at the end
+        # Neighbouring characters of the same style share a single span
+        chars: list[str] = []
+        spans: list[Span] = []
+        run_start = 0
+        run_style: Style | None = None
+
+        get_bar = self._get_cached_bar
+        num_buckets = len(bucketed_results)
+        i = 0
+        while i < num_buckets:
+            result = bucketed_results[i]
             if result is None:
+                # Measure the whole run of empty buckets at once
+                run_end = i + 1
+                while run_end < num_buckets and bucketed_results[run_end] is None:
+                    run_end += 1
+
                 # Determine if this is empty space or a gap in monitoring
-                if first_data_idx is None:
-                    # No data at all yet - show dim dot
-                    char, style = self.EMPTY_CHAR, "dim"
-                elif i < first_data_idx:
-                    # Before first data point - show dim dot
-                    char, style = self.EMPTY_CHAR, "dim"
-                elif i > last_data_idx:
-                    # After last data point - show dim dot
-                    char, style = self.EMPTY_CHAR, "dim"
+                # Runs before the first or after the last data point (or with no data
+                # at all yet) are empty space, runs between data points are gaps
+                is_gap = i > 0 and run_end < num_buckets
+                if is_gap and run_end - i <= self.MAX_ERROR_GAP_SIZE:
+                    # Small gap (≤10 buckets) - show as error
+                    char, style = "!", _ERROR_STYLE
                 else:
-                    # Gap between data points - check size
-                    gap_size = gap_sizes.get(i, 0)
-                    if gap_size <= MAX_ERROR_GAP_SIZE:
-                        # Small gap (≤10 buckets) - show as error
-                        char, style = "!", "red"
-                    else:
-                        # Large gap (>10 buckets) - show as empty space
-                        # This prevents walls of exclamation marks after suspend
-                        char, style = self.EMPTY_CHAR, "dim"
-                graph_text.append(char, style=style)
-            elif result.success and result.latency_ms is not None:
-                # Calculate bar height and color based on latency
-                bar, color = self._get_bar_for_latency(result.latency_ms)
-                graph_text.append(bar, style=color)
+                    # Empty space or large gap (>10 buckets) - show dim dots
+                    # This prevents walls of exclamation marks after suspend
+                    char, style = self.EMPTY_CHAR, _EMPTY_STYLE
+                count = run_end - i
             else:
-                # Failed check - use red exclamation mark
-                graph_text.append("!", style="red")
+                if result.success and result.latency_ms is not None:
+                    # Calculate bar height and color based on latency
+                    char, style = get_bar(result.latency_ms)
+                else:
+                    # Failed check - use red exclamation mark
+                    char, style = "!", _ERROR_STYLE
+                count = 1
 
-        return graph_text
+            if style is not run_style:
+                if run_style is not None:
+                    spans.append(Span(run_start, i, run_style))
+                run_start, run_style = i, style
+            chars.append(char * count)
+            i += count
 
-    def _get_bar_for_latency(self, latency_ms: float) -> tuple[str, str]:
+        if run_style is not None:
+            spans.append(Span(run_start, num_buckets, run_style))
+
+        return Text("".join(chars), spans=spans)
+
+    def _get_bar_for_latency(self, latency_ms: float) -> tuple[str, Style]:
         """
-        Get bar character and color for a given latency.
+        Get bar character and style for a given latency.
 
         Uses constants from ui.constants for consistent color thresholds.
 
         Returns:
-            Tuple of (bar_character, color_name)
+            Tuple of (bar_character, color_style)
         """
-        # Get color using shared logic
-        color = get_latency_color(latency_ms)
+        # The latency level picks both the color and the zone the bar height is relative to
+        level = get_latency_level(latency_ms)
 
         # Determine height ratio within color zone
-        if latency_ms < LATENCY_GREEN_MAX:
-            # Green zone - good
-            ratio = latency_ms / LATENCY_GREEN_MAX
-        elif latency_ms < LATENCY_YELLOW_MAX:
-            # Yellow zone - medium
-            ratio = (latency_ms - LATENCY_GREEN_MAX) / (LATENCY_YELLOW_MAX - LATENCY_GREEN_MAX)
-        elif latency_ms < LATENCY_ORANGE_MAX:
-            # Orange zone - concerning
-            ratio = (latency_ms - LATENCY_YELLOW_MAX) / (LATENCY_ORANGE_MAX - LATENCY_YELLOW_MAX)
-        else:
-            # Red zone - bad
-            ratio = min((latency_ms - LATENCY_ORANGE_MAX) / 300.0, 1.0)
+        ratio = (latency_ms - _ZONE_STARTS[level]) / _ZONE_HEIGHTS[level]
 
         # Map ratio to block character (8 levels per color zone)
         block_index = int(ratio * 7)  # 0-7
@@ -145,16 +159,4 @@ class LatencyGraph:
 
         bar = self.BLOCKS[block_index + 1]  # Skip first block (·)
 
-        return bar, color
-
-    @staticmethod
-    def _worst_color(color1: str, color2: str) -> str:
-        """Return the 'worse' of two colors (for overall graph color)."""
-        # Order from best to worst
-        color_priority = ["green", "yellow", "orange1", "red"]
-
-        idx1 = color_priority.index(color1) if color1 in color_priority else 0
-        idx2 = color_priority.index(color2) if color2 in color_priority else 0
-
-        # Return the one with higher index (worse)
-        return color_priority[max(idx1, idx2)]
+        return bar, _LATENCY_STYLES[level]
@@ -0,0 +1,56 @@
+"""Tests for the HTTP checker."""
+
+import socket
+
+from hydraping.checkers.http import PinnedResolver
+
+
+class _FallbackResolver:
+    """Resolver stub recording the lookups passed on to it."""
+
+    def __init__(self):
+        self.lookups = []
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        self.lookups.append((host, port, family))
+        return []
+
+    async def close(self):
+        pass
+
+
+class TestPinnedResolver:
+    """Test resolving hosts with an already resolved IP."""
+
+    async def test_pinned_host_resolves_to_ip(self):
+        """Test that the pinned host is answered with its IP without a lookup."""
+        resolver = PinnedResolver("example.com", "192.0.2.1")
+        resolver._fallback = fallback = _FallbackResolver()
+
+        (result,) = await resolver.resolve("example.com", 443)
+
+        assert result["hostname"] == "example.com"
+        assert result["host"] == "192.0.2.1"
+        assert result["port"] == 443
+        assert result["family"] == socket.AF_INET
+        assert result["flags"] == socket.AI_NUMERICHOST
+        assert fallback.lookups == []
+
+    async def test_pinned_ipv6_address_family(self):
+        """Test that an IPv6 pinned IP is reported with the IPv6 address family."""
+        resolver = PinnedResolver("example.com", "2001:db8::1")
+        resolver._fallback = _FallbackResolver()
+
+        (result,) = await resolver.resolve("example.com", 80)
+
+        assert result["host"] == "2001:db8::1"
+        assert result["family"] == socket.AF_INET6
+
+    async def test_other_hosts_fall_back(self):
+        """Test that other hosts (e.g. redirect targets) are resolved normally."""
+        resolver = PinnedResolver("example.com", "192.0.2.1")
+        resolver._fallback = fallback = _FallbackResolver()
+
+        await resolver.resolve("www.example.com", 443, socket.AF_UNSPEC)
+
+        assert fallback.lookups == [("www.example.com", 443, socket.AF_UNSPEC)]
@@ -18,7 +18,7 @@ from hydraping.models import (
 
 
 class TestConfigLoading:
-    """Test loading configuration from TOML files."""
+    """Test loading configuration from TOML files and strings."""
 
     def test_load_simple_config(self, tmp_path):
         """Test loading a simple config with basic endpoints."""
@@ -48,153 +48,159 @@ graph_width = 0
         assert isinstance(config.endpoints[1], DomainEndpoint)
         assert isinstance(config.endpoints[2], HTTPEndpoint)
 
-    def test_load_config_with_custom_names(self, tmp_path):
+    def test_load_missing_file(self, tmp_path):
+        """Test that loading a nonexistent config file raises error."""
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            Config.load(tmp_path / "missing.toml")
+
+    def test_load_config_with_custom_names(self):
         """Test loading config with custom endpoint names."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        config = Config.loads("""
 [endpoints]
 targets = [
     { url = "8.8.8.8", name = "Google DNS" },
     { url = "1.1.1.1", name = "Cloudflare DNS" },
 ]
 """)
-
-        config = Config.load(config_file)
         assert config.endpoints[0].custom_name == "Google DNS"
         assert config.endpoints[1].custom_name == "Cloudflare DNS"
 
-    def test_load_config_with_udp_endpoints(self, tmp_path):
+    def test_load_config_with_udp_endpoints(self):
         """Test loading UDP endpoints from config."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        config = Config.loads("""
 [endpoints]
 targets = [
     { url = "1.1.1.1:53", protocol = "udp", name = "Cloudflare DNS (UDP)" },
 ]
 """)
-
-        config = Config.load(config_file)
         assert len(config.endpoints) == 1
         assert isinstance(config.endpoints[0], UDPPortEndpoint)
         assert config.endpoints[0].ip == "1.1.1.1"
         assert config.endpoints[0].port == 53
 
-    def test_load_config_with_udp_probe_hex(self, tmp_path):
+    def test_load_config_with_udp_probe_hex(self):
         """Test loading UDP endpoint with hex probe data."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        config = Config.loads("""
 [endpoints]
 targets = [
     { url = "1.1.1.1:53", protocol = "udp", probe_hex = "deadbeef" },
 ]
 """)
-
-        config = Config.load(config_file)
         endpoint = config.endpoints[0]
         assert isinstance(endpoint, UDPPortEndpoint)
         assert endpoint.probe_data == b"\xde\xad\xbe\xef"
 
-    def test_load_config_with_udp_probe_ascii(self, tmp_path):
+    def test_load_config_with_udp_probe_ascii(self):
         """Test loading UDP endpoint with ASCII probe data."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        config = Config.loads("""
 [endpoints]
 targets = [
     { url = "1.1.1.1:123", protocol = "udp", probe_ascii = "hello" },
 ]
 """)
-
-        config = Config.load(config_file)
         endpoint = config.endpoints[0]
         assert isinstance(endpoint, UDPPortEndpoint)
         assert endpoint.probe_data == b"hello"
 
-    def test_load_config_with_ip_version(self, tmp_path):
+    def test_load_config_with_ip_version(self):
         """Test loading config with IP version preference."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        config = Config.loads("""
 [endpoints]
 targets = [
     { url = "google.com", ip_version = 4 },
     { url = "google.com", ip_version = 6 },
 ]
 """)
-
-        config = Config.load(config_file)
         assert config.endpoints[0].ip_version == 4
         assert config.endpoints[1].ip_version == 6
 
-    def test_load_config_with_http_success_status(self, tmp_path):
+    def test_load_config_with_http_success_status(self):
         """Test loading config with HTTP success status threshold."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        config = Config.loads("""
 [endpoints]
 targets = ["google.com"]
 
 [checks]
 http_success_status_max = 299
 """)
-
-        config = Config.load(config_file)
         assert config.checks.http_success_status_max == 299
 
-    def test_invalid_config_no_endpoints(self, tmp_path):
-        """Test that config without endpoints raises error."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+    def test_load_config_with_max_concurrent_checks(self):
+        """Test loading config with concurrent checks limit."""
+        config = Config.loads("""
 [endpoints]
-targets = []
+targets = ["google.com"]
+
+[checks]
+max_concurrent_checks = 10
 """)
+        assert config.checks.max_concurrent_checks == 10
 
+    def test_invalid_max_concurrent_checks(self):
+        """Test that a non-positive concurrent checks limit raises error."""
+        with pytest.raises(ValueError, match="max_concurrent_checks must be at least 1"):
+            Config.loads("""
+[endpoints]
+targets = ["google.com"]
+
+[checks]
+max_concurrent_checks = 0
+""")
+
+    def test_invalid_config_no_endpoints(self):
+        """Test that config without endpoints raises error."""
         with pytest.raises(ValueError, match="No endpoints configured"):
-            Config.load(config_file)
+            Config.loads("""
+[endpoints]
+targets = []
+""")
 
-    def test_invalid_config_missing_url(self, tmp_path):
+    def test_invalid_config_missing_url(self):
         """Test that endpoint object without url raises error."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        with pytest.raises(ValueError, match="missing 'url' field"):
+            Config.loads("""
 [endpoints]
 targets = [
     { name = "Missing URL" }
 ]
 """)
 
-        with pytest.raises(ValueError, match="missing 'url' field"):
-            Config.load(config_file)
-
-    def test_invalid_udp_probe_hex(self, tmp_path):
+    def test_invalid_udp_probe_hex(self):
         """Test that invalid hex in probe_hex raises error."""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text("""
+        with pytest.raises(ValueError, match="Invalid hex probe_hex"):
+            Config.loads("""
 [endpoints]
 targets = [
     { url = "1.1.1.1:53", protocol = "udp", probe_hex = "invalid" },
 ]
 """)
 
-        with pytest.raises(ValueError, match="Invalid hex probe_hex"):
-            Config.load(config_file)
-
 
 class TestConfigClasses:
     """Test configuration dataclasses."""
 
-    def test_dns_config_defaults(self):
-        """Test DNSConfig default values."""
-        dns = DNSConfig()
-        assert dns.custom_servers == []
-
-    def test_checks_config_defaults(self):
-        """Test ChecksConfig default values."""
-        checks = ChecksConfig()
-        assert checks.interval_seconds == 5.0
-        assert checks.timeout_seconds == 5.0
-        assert checks.http_success_status_max == 399
-
-    def test_ui_config_defaults(self):
-        """Test UIConfig default values."""
-        ui = UIConfig()
-        assert ui.graph_width == 0
+    @pytest.mark.parametrize(
+        ("config_class", "expected_defaults"),
+        [
+            pytest.param(DNSConfig, {"custom_servers": []}, id="dns"),
+            pytest.param(
+                ChecksConfig,
+                {
+                    "interval_seconds": 5.0,
+                    "timeout_seconds": 5.0,
+                    "http_success_status_max": 399,
+                    "max_concurrent_checks": 100,
+                },
+                id="checks",
+            ),
+            pytest.param(UIConfig, {"graph_width": 0}, id="ui"),
+        ],
+    )
+    def test_defaults(self, config_class, expected_defaults):
+        """Test config dataclass default values."""
+        config = config_class()
+        for name, value in expected_defaults.items():
+            assert getattr(config, name) == value
 
 
 class TestCreateDefaultConfig:
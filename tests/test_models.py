@@ -15,170 +15,178 @@ from hydraping.models import (
     HTTPEndpoint,
     IPEndpoint,
     IPPortEndpoint,
+    ResultRingBuffer,
     UDPPortEndpoint,
 )
 
+# Fixed timestamp for results whose time does not matter to the test
+_TIMESTAMP = datetime(2024, 1, 1)
+
 
 class TestEndpointParsing:
     """Test Endpoint.parse() method."""
 
-    def test_parse_ipv4_address(self):
-        """Test parsing plain IPv4 address."""
-        endpoint = Endpoint.parse("8.8.8.8")
-        assert isinstance(endpoint, IPEndpoint)
-        assert endpoint.ip == "8.8.8.8"
-        assert endpoint.raw == "8.8.8.8"
-
-    def test_parse_ipv6_address(self):
-        """Test parsing plain IPv6 address."""
-        endpoint = Endpoint.parse("2001:4860:4860::8888")
-        assert isinstance(endpoint, IPEndpoint)
-        assert endpoint.ip == "2001:4860:4860::8888"
-
-    def test_parse_ipv4_port(self):
-        """Test parsing IPv4:port."""
-        endpoint = Endpoint.parse("1.1.1.1:53")
-        assert isinstance(endpoint, IPPortEndpoint)
-        assert endpoint.ip == "1.1.1.1"
-        assert endpoint.port == 53
-
-    def test_parse_ipv6_port_bracket_notation(self):
-        """Test parsing [IPv6]:port with brackets."""
-        endpoint = Endpoint.parse("[2001:4860:4860::8888]:53")
-        assert isinstance(endpoint, IPPortEndpoint)
-        assert endpoint.ip == "2001:4860:4860::8888"
-        assert endpoint.port == 53
-
-    def test_parse_domain(self):
-        """Test parsing domain name."""
-        endpoint = Endpoint.parse("google.com")
-        assert isinstance(endpoint, DomainEndpoint)
-        assert endpoint.domain == "google.com"
-        assert endpoint.port == 80  # Default port
-        assert endpoint.port_specified is False
-
-    def test_parse_domain_port(self):
-        """Test parsing domain:port."""
-        endpoint = Endpoint.parse("example.com:8080")
-        assert isinstance(endpoint, DomainEndpoint)
-        assert endpoint.domain == "example.com"
-        assert endpoint.port == 8080
-        assert endpoint.port_specified is True
-
-    def test_parse_domain_port_common_ports(self):
-        """Test parsing domain with common ports."""
-        # Port 443
-        endpoint = Endpoint.parse("api.example.com:443")
-        assert isinstance(endpoint, DomainEndpoint)
-        assert endpoint.domain == "api.example.com"
-        assert endpoint.port == 443
-        assert endpoint.port_specified is True
-
-        # Port 3000
-        endpoint = Endpoint.parse("localhost:3000")
-        assert isinstance(endpoint, DomainEndpoint)
-        assert endpoint.domain == "localhost"
-        assert endpoint.port == 3000
-        assert endpoint.port_specified is True
-
-    def test_parse_http_url(self):
-        """Test parsing HTTP URL."""
-        endpoint = Endpoint.parse("http://example.com/path")
-        assert isinstance(endpoint, HTTPEndpoint)
-        assert endpoint.scheme == "http"
-        assert endpoint.host == "example.com"
-        assert endpoint.port == 80
-        assert endpoint.path == "/path"
-
-    def test_parse_https_url(self):
-        """Test parsing HTTPS URL."""
-        endpoint = Endpoint.parse("https://example.com:8443/api")
-        assert isinstance(endpoint, HTTPEndpoint)
-        assert endpoint.scheme == "https"
-        assert endpoint.host == "example.com"
-        assert endpoint.port == 8443
-        assert endpoint.path == "/api"
+    @pytest.mark.parametrize(
+        ("raw", "expected_type", "expected_attrs"),
+        [
+            pytest.param(
+                "8.8.8.8", IPEndpoint, {"ip": "8.8.8.8", "raw": "8.8.8.8"}, id="ipv4"
+            ),
+            pytest.param(
+                "2001:4860:4860::8888", IPEndpoint, {"ip": "2001:4860:4860::8888"}, id="ipv6"
+            ),
+            pytest.param(
+                "1.1.1.1:53", IPPortEndpoint, {"ip": "1.1.1.1", "port": 53}, id="ipv4-port"
+            ),
+            pytest.param(
+                "[2001:4860:4860::8888]:53",
+                IPPortEndpoint,
+                {"ip": "2001:4860:4860::8888", "port": 53},
+                id="ipv6-port-brackets",
+            ),
+            pytest.param(
+                "google.com",
+                DomainEndpoint,
+                {"domain": "google.com", "port": 80, "port_specified": False},
+                id="domain-default-port",
+            ),
+            pytest.param(
+                "example.com:8080",
+                DomainEndpoint,
+                {"domain": "example.com", "port": 8080, "port_specified": True},
+                id="domain-port",
+            ),
+            pytest.param(
+                "api.example.com:443",
+                DomainEndpoint,
+                {"domain": "api.example.com", "port": 443, "port_specified": True},
+                id="domain-port-443",
+            ),
+            pytest.param(
+                "localhost:3000",
+                DomainEndpoint,
+                {"domain": "localhost", "port": 3000, "port_specified": True},
+                id="domain-port-3000",
+            ),
+            pytest.param(
+                "http://example.com/path",
+                HTTPEndpoint,
+                {"scheme": "http", "host": "example.com", "port": 80, "path": "/path"},
+                id="http-url",
+            ),
+            pytest.param(
+                "https://example.com:8443/api",
+                HTTPEndpoint,
+                {"scheme": "https", "host": "example.com", "port": 8443, "path": "/api"},
+                id="https-url",
+            ),
+        ],
+    )
+    def test_parse(self, raw, expected_type, expected_attrs):
+        """Test that each endpoint format parses to the right type and fields."""
+        endpoint = Endpoint.parse(raw)
+        assert isinstance(endpoint, expected_type)
+        for name, value in expected_attrs.items():
+            assert getattr(endpoint, name) == value
 
 
 class TestEndpointDisplayNames:
     """Test endpoint display name formatting."""
 
-    def test_ipv4_port_display_name(self):
-        """Test IPv4:port display name."""
-        endpoint = IPPortEndpoint(raw="1.1.1.1:53", ip="1.1.1.1", port=53)
-        assert endpoint.display_name == "1.1.1.1:53"
-
-    def test_ipv6_port_display_name_with_brackets(self):
-        """Test IPv6:port displays with bracket notation."""
-        endpoint = IPPortEndpoint(raw="[2001:db8::1]:80", ip="2001:db8::1", port=80)
-        assert endpoint.display_name == "[2001:db8::1]:80"
-
-    def test_udp_port_display_name_ipv4(self):
-        """Test UDP port display name for IPv4."""
-        endpoint = UDPPortEndpoint(raw="1.1.1.1:53", ip="1.1.1.1", port=53)
-        assert endpoint.display_name == "1.1.1.1:53 (UDP)"
-
-    def test_udp_port_display_name_ipv6(self):
-        """Test UDP port display name for IPv6 with brackets."""
-        endpoint = UDPPortEndpoint(raw="[2001:db8::1]:53", ip="2001:db8::1", port=53)
-        assert endpoint.display_name == "[2001:db8::1]:53 (UDP)"
-
-    def test_domain_default_port_display_name(self):
-        """Test domain with default port (80) doesn't show port."""
-        endpoint = DomainEndpoint(raw="example.com", domain="example.com", port=80)
-        assert endpoint.display_name == "example.com"
-
-    def test_domain_custom_port_display_name(self):
-        """Test domain with custom port shows port."""
-        endpoint = DomainEndpoint(raw="example.com:8080", domain="example.com", port=8080)
-        assert endpoint.display_name == "example.com:8080"
-
-    def test_custom_name_overrides_default(self):
-        """Test custom_name overrides default formatting."""
-        endpoint = IPEndpoint(raw="8.8.8.8", ip="8.8.8.8", custom_name="Google DNS")
-        assert endpoint.display_name == "Google DNS"
+    @pytest.mark.parametrize(
+        ("endpoint", "expected"),
+        [
+            pytest.param(
+                IPPortEndpoint(raw="1.1.1.1:53", ip="1.1.1.1", port=53),
+                "1.1.1.1:53",
+                id="ipv4-port",
+            ),
+            pytest.param(
+                IPPortEndpoint(raw="[2001:db8::1]:80", ip="2001:db8::1", port=80),
+                "[2001:db8::1]:80",
+                id="ipv6-port-brackets",
+            ),
+            pytest.param(
+                UDPPortEndpoint(raw="1.1.1.1:53", ip="1.1.1.1", port=53),
+                "1.1.1.1:53 (UDP)",
+                id="udp-ipv4",
+            ),
+            pytest.param(
+                UDPPortEndpoint(raw="[2001:db8::1]:53", ip="2001:db8::1", port=53),
+                "[2001:db8::1]:53 (UDP)",
+                id="udp-ipv6-brackets",
+            ),
+            pytest.param(
+                DomainEndpoint(raw="example.com", domain="example.com", port=80),
+                "example.com",
+                id="domain-default-port-hidden",
+            ),
+            pytest.param(
+                DomainEndpoint(raw="example.com:8080", domain="example.com", port=8080),
+                "example.com:8080",
+                id="domain-custom-port-shown",
+            ),
+            pytest.param(
+                IPEndpoint(raw="8.8.8.8", ip="8.8.8.8", custom_name="Google DNS"),
+                "Google DNS",
+                id="custom-name-overrides",
+            ),
+        ],
+    )
+    def test_display_name(self, endpoint, expected):
+        """Test the display name of each endpoint kind."""
+        assert endpoint.display_name == expected
 
 
 class TestPrimaryCheckType:
     """Test default primary check type selection."""
 
-    def test_ipportendpoint_defaults_to_tcp(self):
-        """Test IPPortEndpoint uses TCP as primary check by default."""
-        endpoint = IPPortEndpoint(raw="1.1.1.1:8080", ip="1.1.1.1", port=8080)
-        assert endpoint.get_primary_check_type() == CheckType.TCP
-
-    def test_domain_without_explicit_port_uses_icmp(self):
-        """Test DomainEndpoint without explicit port uses ICMP as primary."""
-        endpoint = DomainEndpoint(
-            raw="example.com", domain="example.com", port=80, port_specified=False
-        )
-        assert endpoint.get_primary_check_type() == CheckType.ICMP
-
-    def test_domain_explicit_port_80_uses_tcp(self):
-        """Test DomainEndpoint with explicit port 80 uses TCP as primary."""
-        endpoint = DomainEndpoint(
-            raw="example.com:80", domain="example.com", port=80, port_specified=True
-        )
-        assert endpoint.get_primary_check_type() == CheckType.TCP
-
-    def test_domain_custom_port_uses_tcp(self):
-        """Test DomainEndpoint with custom port uses TCP as primary."""
-        endpoint = DomainEndpoint(
-            raw="example.com:8080", domain="example.com", port=8080, port_specified=True
-        )
-        assert endpoint.get_primary_check_type() == CheckType.TCP
-
-    def test_domain_port_443_uses_tcp(self):
-        """Test DomainEndpoint with port 443 uses TCP as primary."""
-        endpoint = DomainEndpoint(
-            raw="example.com:443", domain="example.com", port=443, port_specified=True
-        )
-        assert endpoint.get_primary_check_type() == CheckType.TCP
-
-    def test_httpendpoint_defaults_to_http(self):
-        """Test HTTPEndpoint uses HTTP as primary check by default."""
-        endpoint = HTTPEndpoint.from_string("https://example.com")
-        assert endpoint.get_primary_check_type() == CheckType.HTTP
+    @pytest.mark.parametrize(
+        ("endpoint", "expected"),
+        [
+            pytest.param(
+                IPPortEndpoint(raw="1.1.1.1:8080", ip="1.1.1.1", port=8080),
+                CheckType.TCP,
+                id="ip-port-tcp",
+            ),
+            pytest.param(
+                DomainEndpoint(
+                    raw="example.com", domain="example.com", port=80, port_specified=False
+                ),
+                CheckType.ICMP,
+                id="domain-without-port-icmp",
+            ),
+            pytest.param(
+                DomainEndpoint(
+                    raw="example.com:80", domain="example.com", port=80, port_specified=True
+                ),
+                CheckType.TCP,
+                id="domain-explicit-port-80-tcp",
+            ),
+            pytest.param(
+                DomainEndpoint(
+                    raw="example.com:8080", domain="example.com", port=8080, port_specified=True
+                ),
+                CheckType.TCP,
+                id="domain-custom-port-tcp",
+            ),
+            pytest.param(
+                DomainEndpoint(
+                    raw="example.com:443", domain="example.com", port=443, port_specified=True
+                ),
+                CheckType.TCP,
+                id="domain-port-443-tcp",
+            ),
+            pytest.param(
+                HTTPEndpoint.from_string("https://example.com"),
+                CheckType.HTTP,
+                id="http-url-http",
+            ),
+        ],
+    )
+    def test_default_primary_check_type(self, endpoint, expected):
+        """Test which check type an endpoint uses as primary by default."""
+        assert endpoint.get_primary_check_type() == expected
 
 
 class TestCheckResult:
@@ -188,7 +196,7 @@ class TestCheckResult:
         """Test that successful checks must have latency."""
         with pytest.raises(ValueError, match="Successful check must have latency"):
             CheckResult(
-                timestamp=datetime.now(),
+                timestamp=_TIMESTAMP,
                 check_type=CheckType.ICMP,
                 success=True,
                 latency_ms=None,  # Missing latency
@@ -198,7 +206,7 @@ class TestCheckResult:
         """Test that failed checks must have error message."""
         with pytest.raises(ValueError, match="Failed check must have error message"):
             CheckResult(
-                timestamp=datetime.now(),
+                timestamp=_TIMESTAMP,
                 check_type=CheckType.ICMP,
                 success=False,
                 error_message=None,  # Missing error
@@ -207,7 +215,7 @@ class TestCheckResult:
     def test_valid_successful_check(self):
         """Test creating valid successful check."""
         result = CheckResult(
-            timestamp=datetime.now(),
+            timestamp=_TIMESTAMP,
             check_type=CheckType.ICMP,
             success=True,
             latency_ms=10.5,
@@ -218,7 +226,7 @@ class TestCheckResult:
     def test_valid_failed_check(self):
         """Test creating valid failed check."""
         result = CheckResult(
-            timestamp=datetime.now(),
+            timestamp=_TIMESTAMP,
             check_type=CheckType.ICMP,
             success=False,
             error_message="Timeout",
@@ -226,6 +234,87 @@ class TestCheckResult:
         assert not result.success
         assert result.error_message == "Timeout"
 
+    def test_check_result_is_slotted(self):
+        """Test that check results carry no per-instance dict."""
+        result = CheckResult(
+            timestamp=_TIMESTAMP,
+            check_type=CheckType.ICMP,
+            success=True,
+            latency_ms=10.5,
+        )
+        assert not hasattr(result, "__dict__")
+
+    def test_check_result_unix_timestamp(self):
+        """Test that the POSIX timestamp is converted once on creation."""
+        timestamp = _TIMESTAMP
+        result = CheckResult(
+            timestamp=timestamp,
+            check_type=CheckType.ICMP,
+            success=True,
+            latency_ms=10.5,
+        )
+        assert result.unix_timestamp == timestamp.timestamp()
+
+
+class TestResultRingBuffer:
+    """Test the fixed-capacity result ring buffer."""
+
+    @staticmethod
+    def _make_result(latency_ms: float) -> CheckResult:
+        return CheckResult(
+            timestamp=_TIMESTAMP,
+            check_type=CheckType.ICMP,
+            success=True,
+            latency_ms=latency_ms,
+        )
+
+    def test_capacity_is_exact(self):
+        """Test that the buffer keeps exactly the requested number of results."""
+        buffer = ResultRingBuffer(5)
+        assert buffer.capacity == 5
+
+        for latency in range(12):
+            buffer.append(self._make_result(float(latency)))
+        assert len(buffer) == 5
+        assert [r.latency_ms for r in buffer] == [7.0, 8.0, 9.0, 10.0, 11.0]
+        assert [r.latency_ms for r in reversed(buffer)] == [11.0, 10.0, 9.0, 8.0, 7.0]
+
+    def test_invalid_capacity(self):
+        """Test that non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            ResultRingBuffer(0)
+
+    def test_iterates_oldest_to_newest(self):
+        """Test iteration order before the buffer wraps around."""
+        buffer = ResultRingBuffer(4)
+        for latency in (1.0, 2.0, 3.0):
+            buffer.append(self._make_result(latency))
+
+        assert len(buffer) == 3
+        assert [r.latency_ms for r in buffer] == [1.0, 2.0, 3.0]
+
+    def test_overwrites_oldest_when_full(self):
+        """Test that the oldest results are dropped after wrapping around."""
+        buffer = ResultRingBuffer(4)
+        for latency in (1.0, 2.0, 3.0, 4.0, 5.0, 6.0):
+            buffer.append(self._make_result(latency))
+
+        assert len(buffer) == 4
+        assert [r.latency_ms for r in buffer] == [3.0, 4.0, 5.0, 6.0]
+
+    def test_reversed_iterates_newest_to_oldest(self):
+        """Test reverse iteration before and after wrapping around."""
+        buffer = ResultRingBuffer(4)
+        assert list(reversed(buffer)) == []
+
+        for latency in (1.0, 2.0, 3.0):
+            buffer.append(self._make_result(latency))
+        assert [r.latency_ms for r in reversed(buffer)] == [3.0, 2.0, 1.0]
+
+        for latency in (4.0, 5.0, 6.0):
+            buffer.append(self._make_result(latency))
+        assert [r.latency_ms for r in reversed(buffer)] == [6.0, 5.0, 4.0, 3.0]
+
 
 class TestEndpointResultHistory:
     """Test EndpointResultHistory time bucketing and result selection."""
@@ -237,7 +326,7 @@ class TestEndpointResultHistory:
         assert history.start_timestamp is None
 
         result = CheckResult(
-            timestamp=datetime.now(),
+            timestamp=_TIMESTAMP,
             check_type=CheckType.ICMP,
             success=True,
             latency_ms=10.0,
@@ -260,17 +349,18 @@ class TestEndpointResultHistory:
         history = EndpointResultHistory(interval_seconds=1.0)
 
         # Add results manually setting start times
+        start = time.time()
         history.start_time = time.monotonic()
-        history.start_timestamp = time.time()
+        history.start_timestamp = start
 
         result1 = CheckResult(
-            timestamp=datetime.now(),
+            timestamp=datetime.fromtimestamp(start + 0.5),
             check_type=CheckType.ICMP,
             success=True,
             latency_ms=10.0,
         )
         result2 = CheckResult(
-            timestamp=datetime.now(),
+            timestamp=datetime.fromtimestamp(start + 1.5),
             check_type=CheckType.TCP,
             success=True,
             latency_ms=20.0,
@@ -278,11 +368,11 @@ class TestEndpointResultHistory:
         )
 
         history.add_result(result1)
-        time.sleep(0.1)  # Small delay
         history.add_result(result2)
 
-        bucketed = history.get_bucketed_results(5)
-        assert len(bucketed) == 5
+        # A fixed "now" in bucket 2 instead of waiting for real time to pass
+        bucketed = history.get_bucketed_results(5, now=start + 2.5)
+        assert bucketed == [None, None, result1, result2, None]
 
     def test_priority_selection_prefers_higher_checks(self):
         """Test that higher priority checks are selected over lower."""
@@ -347,6 +437,221 @@ class TestEndpointResultHistory:
         assert current is not None
         assert current.check_type == CheckType.ICMP
 
+    def test_get_latest_by_type(self):
+        """Test that the most recent result of each check type is returned."""
+        history = EndpointResultHistory(interval_seconds=1.0)
+        assert history.get_latest_by_type(CheckType.ICMP) is None
+
+        first_icmp = CheckResult(
+            timestamp=_TIMESTAMP,
+            check_type=CheckType.ICMP,
+            success=True,
+            latency_ms=10.0,
+        )
+        tcp_result = CheckResult(
+            timestamp=_TIMESTAMP,
+            check_type=CheckType.TCP,
+            success=True,
+            latency_ms=20.0,
+            port=80,
+        )
+        last_icmp = CheckResult(
+            timestamp=_TIMESTAMP,
+            check_type=CheckType.ICMP,
+            success=False,
+            error_message="Timeout",
+        )
+        history.add_result(first_icmp)
+        history.add_result(tcp_result)
+        history.add_result(last_icmp)
+
+        assert history.get_latest_by_type(CheckType.ICMP) is last_icmp
+        assert history.get_latest_by_type(CheckType.TCP) is tcp_result
+        assert history.get_latest_by_type(CheckType.HTTP) is None
+
+    def test_repeated_failures_are_coalesced(self):
+        """Test that identical consecutive failures are stored as one result."""
+        history = EndpointResultHistory(interval_seconds=1.0)
+        start = time.time()
+        history.start_time = time.monotonic()
+        history.start_timestamp = start
+
+        for i in range(4):
+            history.add_result(
+                CheckResult(
+                    timestamp=datetime.fromtimestamp(start + i + 0.5),
+                    check_type=CheckType.ICMP,
+                    success=False,
+                    error_message="Timeout",
+                )
+            )
+
+        assert len(history.results) == 1
+        # Coalesced repeats still count as changes for cached views
+        assert history.version == 4
+        run = history.get_latest_by_type(CheckType.ICMP)
+        assert run.repeat_count == 4
+        assert run.last_timestamp == datetime.fromtimestamp(start + 3.5)
+
+        # The single stored result still covers every bucket it was repeated in
+        bucketed = history.get_bucketed_results(6, now=start + 5.5)
+        assert bucketed[:4] == [run, run, run, run]
+        assert bucketed[4:] == [None, None]
+
+    def test_failures_after_gap_are_not_coalesced(self):
+        """Test that a failure after skipped buckets (e.g. suspend) starts a new result."""
+        history = EndpointResultHistory(interval_seconds=1.0)
+        start = time.time()
+        history.start_time = time.monotonic()
+        history.start_timestamp = start
+
+        # Buckets 0 and 1, then nothing until bucket 4
+        for offset in (0.5, 1.5, 4.5):
+            history.add_result(
+                CheckResult(
+                    timestamp=datetime.fromtimestamp(start + offset),
+                    check_type=CheckType.ICMP,
+                    success=False,
+                    error_message="Timeout",
+                )
+            )
+
+        assert len(history.results) == 2
+        first_run, after_gap = history.results
+        assert first_run.repeat_count == 2
+        assert after_gap.repeat_count == 1
+
+        # The skipped buckets stay empty instead of rendering as failures
+        bucketed = history.get_bucketed_results(6, now=start + 5.5)
+        assert bucketed == [first_run, first_run, None, None, after_gap, None]
+
+    def test_failures_on_sibling_ports_are_coalesced_separately(self):
+        """Test that TCP failures alternating between ports 80 and 443 still coalesce."""
+        history = EndpointResultHistory(interval_seconds=1.0)
+        start = time.time()
+        history.start_time = time.monotonic()
+        history.start_timestamp = start
+
+        for i in range(5):
+            for port in (80, 443):
+                history.add_result(
+                    CheckResult(
+                        timestamp=datetime.fromtimestamp(start + i + 0.5),
+                        check_type=CheckType.TCP,
+                        success=False,
+                        error_message="Connection refused",
+                        port=port,
+                    )
+                )
+
+        assert len(history.results) == 2
+        run_80, run_443 = history.results
+        assert (run_80.port, run_80.repeat_count) == (80, 5)
+        assert (run_443.port, run_443.repeat_count) == (443, 5)
+        assert history.get_latest_by_type(CheckType.TCP) is run_443
+
+    def test_bucketed_results_include_older_sibling_port_run(self):
+        """Test that a newer run on another port doesn't hide an older run in the window."""
+        history = EndpointResultHistory(interval_seconds=1.0)
+        start = time.time()
+        history.start_time = time.monotonic()
+        history.start_timestamp = start
+
+        for i in range(10):
+            timestamp = datetime.fromtimestamp(start + i + 0.5)
+            history.add_result(
+                CheckResult(
+                    timestamp=timestamp,
+                    check_type=CheckType.TCP,
+                    success=False,
+                    error_message="Connection refused",
+                    port=80,
+                )
+            )
+            # Port 443 starts failing differently, but only for the first buckets
+            if i < 3:
+                history.add_result(
+                    CheckResult(
+                        timestamp=timestamp,
+                        check_type=CheckType.TCP,
+                        success=False,
+                        error_message="Timeout",
+                        port=443,
+                    )
+                )
+
+        run_80 = history.get_latest_by_type(CheckType.TCP)
+        assert run_80.port == 80
+        bucketed = history.get_bucketed_results(5, now=start + 9.5)
+        assert bucketed == [run_80] * 5
+
+    def test_bucketed_results_include_long_running_failure(self):
+        """Test that a failure run starting before the window still fills it."""
+        history = EndpointResultHistory(interval_seconds=1.0)
+        start = time.time()
+        history.start_time = time.monotonic()
+        history.start_timestamp = start
+
+        for i in range(20):
+            timestamp = datetime.fromtimestamp(start + i + 0.5)
+            history.add_result(
+                CheckResult(
+                    timestamp=timestamp,
+                    check_type=CheckType.ICMP,
+                    success=False,
+                    error_message="Timeout",
+                )
+            )
+            if i < 15:
+                history.add_result(
+                    CheckResult(
+                        timestamp=timestamp,
+                        check_type=CheckType.DNS,
+                        success=True,
+                        latency_ms=5.0,
+                    )
+                )
+
+        # The ICMP run was stored long before the newer DNS results, but it still
+        # covers the buckets after DNS results stopped
+        run = history.get_latest_by_type(CheckType.ICMP)
+        bucketed = history.get_bucketed_results(10, now=start + 20.5)
+        assert [r.check_type for r in bucketed[:4]] == [CheckType.DNS] * 4
+        assert bucketed[4:9] == [run] * 5
+        assert bucketed[9] is None
+
+    def test_different_failures_are_not_coalesced(self):
+        """Test that a changed error or a success starts a new result."""
+        history = EndpointResultHistory(interval_seconds=1.0)
+
+        for error_message in ("Timeout", "Timeout", "Host unreachable"):
+            history.add_result(
+                CheckResult(
+                    timestamp=_TIMESTAMP,
+                    check_type=CheckType.ICMP,
+                    success=False,
+                    error_message=error_message,
+                )
+            )
+        history.add_result(
+            CheckResult(
+                timestamp=_TIMESTAMP,
+                check_type=CheckType.ICMP,
+                success=True,
+                latency_ms=10.0,
+            )
+        )
+        history.add_result(
+            CheckResult(
+                timestamp=_TIMESTAMP,
+                check_type=CheckType.ICMP,
+                success=False,
+                error_message="Host unreachable",
+            )
+        )
+
+        assert [r.repeat_count for r in history.results] == [2, 1, 1, 1]
+
     def test_check_type_priority_order(self):
         """Test that CHECK_TYPE_PRIORITY is correctly ordered."""
         assert CHECK_TYPE_PRIORITY[0] == CheckType.HTTP
@@ -355,6 +660,12 @@ class TestEndpointResultHistory:
         assert CHECK_TYPE_PRIORITY[3] == CheckType.DNS
         assert CHECK_TYPE_PRIORITY[4] == CheckType.ICMP
 
+    def test_check_type_value_matches_priority(self):
+        """Test that CheckType values order check types by priority."""
+        assert tuple(sorted(CheckType, reverse=True)) == CHECK_TYPE_PRIORITY
+        # Values index per-type lists in EndpointResultHistory
+        assert sorted(CheckType) == list(range(len(CheckType)))
+
 
 class TestUDPProbeData:
     """Test UDP probe data configuration."""
@@ -0,0 +1,259 @@
+"""Tests for check orchestration."""
+
+import asyncio
+import time
+from datetime import datetime
+
+import dns.asyncresolver
+import dns.resolver
+
+from hydraping.config import ChecksConfig, Config
+from hydraping.models import CheckResult, CheckType, Endpoint
+from hydraping.orchestrator import CheckOrchestrator
+
+# Fixed timestamp for results whose time does not matter to the test
+_TIMESTAMP = datetime(2024, 1, 1)
+
+
+def _make_orchestrator(*targets: str, **checks) -> CheckOrchestrator:
+    """Create an orchestrator for the given targets and checks settings."""
+    config = Config(
+        endpoints=[Endpoint.parse(target) for target in targets],
+        checks=ChecksConfig(**checks),
+    )
+    return CheckOrchestrator(config)
+
+
+def _stub_check(check_type: CheckType, calls: list | None = None):
+    """Make a checker stub that records its arguments and succeeds."""
+
+    async def check(*args):
+        if calls is not None:
+            calls.append(args)
+        timestamp = next(arg for arg in args if isinstance(arg, datetime))
+        return CheckResult(
+            timestamp=timestamp, check_type=check_type, success=True, latency_ms=1.0
+        )
+
+    return check
+
+
+async def _wait_for_results(orchestrator: CheckOrchestrator, count: int) -> None:
+    """Wait until at least count results were written to history."""
+    async with asyncio.timeout(5):
+        # The version counts every added result, including coalesced repeats
+        while sum(history.version for history in orchestrator.history.values()) < count:
+            await orchestrator.results_changed.wait()
+            orchestrator.results_changed.clear()
+
+
+class TestOrchestratorLifecycle:
+    """Test starting and stopping the orchestrator."""
+
+    async def test_start_keeps_loop_task_factory(self):
+        """Test that only check tasks start eagerly, not every task on the loop."""
+        orchestrator = _make_orchestrator("8.8.8.8", interval_seconds=60.0)
+        orchestrator.icmp_checker.check = _stub_check(CheckType.ICMP)
+        loop = asyncio.get_running_loop()
+        task_factory = loop.get_task_factory()
+
+        await orchestrator.start()
+        try:
+            await _wait_for_results(orchestrator, 1)
+            assert loop.get_task_factory() is task_factory
+        finally:
+            await orchestrator.stop()
+        assert loop.get_task_factory() is task_factory
+
+
+class TestScheduling:
+    """Test running check iterations on the interval grid."""
+
+    async def test_missed_iterations_are_skipped(self):
+        """Test that iterations missed during a slow check are not replayed in a burst."""
+        interval = 0.05
+        orchestrator = _make_orchestrator("8.8.8.8", interval_seconds=interval)
+        starts = []
+
+        async def check_icmp(target, iteration_timestamp):
+            starts.append(time.monotonic())
+            if len(starts) == 1:
+                # Overrun several intervals
+                await asyncio.sleep(6 * interval)
+            return await _stub_check(CheckType.ICMP)(target, iteration_timestamp)
+
+        orchestrator.icmp_checker.check = check_icmp
+
+        await orchestrator.start()
+        try:
+            await _wait_for_results(orchestrator, 4)
+        finally:
+            await orchestrator.stop()
+
+        # The late iteration starts right away, but the following ones are back on the
+        # interval grid instead of catching up on the missed ones back to back
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+        assert gaps[0] >= 6 * interval
+        assert min(gaps[1:3]) > interval / 2
+        assert len(starts) < 6
+
+
+class TestCheckPlans:
+    """Test which checks the orchestrator schedules for endpoints."""
+
+    async def test_icmp_stage_dropped_once_unavailable(self):
+        """Test that ICMP checks stop being scheduled after ICMP turns out unavailable."""
+        orchestrator = _make_orchestrator("1.1.1.1:80", interval_seconds=0.01)
+        icmp_calls = []
+        stub_icmp = _stub_check(CheckType.ICMP, icmp_calls)
+
+        async def check_icmp(*args):
+            # The first ping finds out there are no permissions for raw sockets
+            orchestrator.icmp_checker._permission_denied = True
+            return await stub_icmp(*args)
+
+        orchestrator.icmp_checker.check = check_icmp
+        orchestrator.tcp_checker.check = _stub_check(CheckType.TCP)
+
+        await orchestrator.start()
+        try:
+            # One ICMP and one TCP result from the first iteration, then TCP only
+            await _wait_for_results(orchestrator, 5)
+        finally:
+            await orchestrator.stop()
+
+        assert len(icmp_calls) == 1
+        (plan,) = orchestrator._plans.values()
+        assert [check.func for stage in plan for check in stage] == [orchestrator._check_tcp]
+
+
+class TestResolvedTargets:
+    """Test passing IPs resolved by the DNS check on to the other checks."""
+
+    async def test_failed_dns_check_unpins_resolved_ip(self, monkeypatch):
+        """Test that TCP and HTTP go back to the hostname once DNS resolution fails."""
+        answers = [["192.0.2.1"], dns.resolver.NXDOMAIN()]
+
+        class FakeResolver:
+            async def resolve(self, target, rdtype):
+                answer = answers.pop(0)
+                if isinstance(answer, Exception):
+                    raise answer
+                return answer
+
+        monkeypatch.setattr(dns.asyncresolver, "Resolver", FakeResolver)
+
+        orchestrator = _make_orchestrator("https://example.com/")
+        tcp_calls, http_calls = [], []
+        orchestrator.icmp_checker.check = _stub_check(CheckType.ICMP)
+        orchestrator.tcp_checker.check = _stub_check(CheckType.TCP, tcp_calls)
+        orchestrator.http_checker.check = _stub_check(CheckType.HTTP, http_calls)
+        (plan,) = orchestrator._plans.values()
+
+        await orchestrator._run_plan(plan, _TIMESTAMP)
+        await orchestrator._run_plan(plan, _TIMESTAMP)
+
+        # Pinned to the resolved IP while DNS works, back to the hostname once it fails
+        assert [host for host, _port, _ts in tcp_calls] == ["192.0.2.1", "example.com"]
+        assert [ip for _url, _ts, ip in http_calls] == ["192.0.2.1", None]
+
+
+class TestConcurrencyLimit:
+    """Test bounding the number of checks running at once."""
+
+    async def test_checks_respect_max_concurrent_checks(self):
+        """Test that checks beyond the limit wait, and failing checks release their slot."""
+        targets = [f"192.0.2.{i}:80" for i in range(1, 7)]
+        orchestrator = _make_orchestrator(*targets, interval_seconds=60.0, max_concurrent_checks=2)
+        orchestrator.icmp_checker.check = _stub_check(CheckType.ICMP)
+        running = peak = 0
+
+        async def check_tcp(host, port, iteration_timestamp):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                await asyncio.sleep(0.01)
+                if host.endswith((".1", ".2", ".3")):
+                    raise RuntimeError("boom")
+                return CheckResult(
+                    timestamp=iteration_timestamp,
+                    check_type=CheckType.TCP,
+                    success=True,
+                    latency_ms=1.0,
+                    port=port,
+                )
+            finally:
+                running -= 1
+
+        orchestrator.tcp_checker.check = check_tcp
+
+        await orchestrator.start()
+        try:
+            # An ICMP and a TCP result per endpoint; a leaked slot would deadlock here
+            await _wait_for_results(orchestrator, 2 * len(targets))
+        finally:
+            await orchestrator.stop()
+
+        assert peak == 2
+        tcp_results = [
+            orchestrator.get_latest_result(endpoint, CheckType.TCP)
+            for endpoint in orchestrator.endpoints
+        ]
+        assert [result.success for result in tcp_results] == [False] * 3 + [True] * 3
+        assert tcp_results[0].error_message == "Unexpected error: boom"
+
+
+class TestResultWriter:
+    """Test writing check results to history."""
+
+    async def test_stored_results_reach_history(self):
+        """Test that stored results are added to history and announced."""
+        orchestrator = _make_orchestrator("8.8.8.8", "1.1.1.1")
+        first, second = orchestrator.endpoints
+        orchestrator._writer_task = asyncio.create_task(orchestrator._write_results())
+        try:
+            result = CheckResult(
+                timestamp=_TIMESTAMP, check_type=CheckType.ICMP, success=True, latency_ms=1.0
+            )
+            orchestrator._store_result(second, result)
+            async with asyncio.timeout(5):
+                await orchestrator.results_changed.wait()
+        finally:
+            await orchestrator.stop()
+
+        assert orchestrator.get_latest_result(second, CheckType.ICMP) is result
+        assert orchestrator.get_latest_result(first, CheckType.ICMP) is None
+
+    async def test_writer_survives_failing_result(self, caplog):
+        """Test that a result failing to be stored is logged and later results still land."""
+        orchestrator = _make_orchestrator("8.8.8.8")
+        (endpoint,) = orchestrator.endpoints
+        history = orchestrator.get_history(endpoint)
+        add_result = history.add_result
+        failures = [RuntimeError("boom")]
+
+        def flaky_add_result(result):
+            if failures:
+                raise failures.pop()
+            add_result(result)
+
+        history.add_result = flaky_add_result
+        orchestrator._writer_task = asyncio.create_task(orchestrator._write_results())
+        try:
+            for latency_ms in (1.0, 2.0):
+                orchestrator._store_result(
+                    endpoint,
+                    CheckResult(
+                        timestamp=_TIMESTAMP,
+                        check_type=CheckType.ICMP,
+                        success=True,
+                        latency_ms=latency_ms,
+                    ),
+                )
+            await _wait_for_results(orchestrator, 1)
+        finally:
+            await orchestrator.stop()
+
+        assert orchestrator.get_latest_result(endpoint, CheckType.ICMP).latency_ms == 2.0
+        assert "Failed to store ICMP check result" in caplog.text
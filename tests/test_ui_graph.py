@@ -2,9 +2,49 @@
 
 from datetime import datetime
 
+import pytest
+
 from hydraping.models import CheckResult, CheckType
+from hydraping.ui.constants import (
+    LATENCY_GREEN_MAX,
+    LATENCY_ORANGE_MAX,
+    LATENCY_YELLOW_MAX,
+    get_latency_color,
+)
 from hydraping.ui.graph import LatencyGraph
 
+# Rendering never looks at timestamps, so all results share a fixed one
+_TIMESTAMP = datetime(2024, 1, 1)
+
+
+# Rendering never modifies results, so all graph tests share the same ones
+@pytest.fixture(scope="module")
+def success_result() -> CheckResult:
+    return CheckResult(
+        timestamp=_TIMESTAMP,
+        check_type=CheckType.ICMP,
+        success=True,
+        latency_ms=10.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def failed_result() -> CheckResult:
+    return CheckResult(
+        timestamp=_TIMESTAMP,
+        check_type=CheckType.ICMP,
+        success=False,
+        error_message="Timeout",
+    )
+
+
+def _bucketed(width: int, placements: dict[int, CheckResult]) -> list[CheckResult | None]:
+    """Build a bucketed results list with results at the given positions."""
+    bucketed: list[CheckResult | None] = [None] * width
+    for index, result in placements.items():
+        bucketed[index] = result
+    return bucketed
+
 
 class TestLatencyGraph:
     """Test latency graph rendering."""
@@ -19,19 +59,19 @@ class TestLatencyGraph:
         assert len(result.plain) == 10
         assert "·" in result.plain
 
-    def test_successful_result_renders_bar(self):
+    def test_render_empty_matches_empty_render(self):
+        """Test that the cached empty graph matches rendering no data."""
+        graph = LatencyGraph(width=10)
+
+        empty = graph.render_empty()
+        assert empty.plain == graph.render([None] * 10).plain
+        assert graph.render_empty() is empty
+
+    def test_successful_result_renders_bar(self, success_result):
         """Test that successful check renders colored bar."""
         graph = LatencyGraph(width=5)
 
-        # Create a successful result
-        result = CheckResult(
-            timestamp=datetime.now(),
-            check_type=CheckType.ICMP,
-            success=True,
-            latency_ms=25.0,
-        )
-
-        bucketed = [None, None, result, None, None]
+        bucketed = _bucketed(5, {2: success_result})
         rendered = graph.render(bucketed)
 
         # Should have some block character (not just dots)
@@ -39,68 +79,57 @@ class TestLatencyGraph:
         # Green latency should use a block character
         assert any(c in rendered.plain for c in "▁▂▃▄▅▆▇█")
 
-    def test_failed_result_renders_exclamation(self):
+    def test_failed_result_renders_exclamation(self, failed_result):
         """Test that failed check renders exclamation mark."""
         graph = LatencyGraph(width=5)
 
-        result = CheckResult(
-            timestamp=datetime.now(),
-            check_type=CheckType.ICMP,
-            success=False,
-            error_message="Timeout",
-        )
-
-        bucketed = [None, None, result, None, None]
+        bucketed = _bucketed(5, {2: failed_result})
         rendered = graph.render(bucketed)
 
         assert "!" in rendered.plain
 
-    def test_gap_detection_small_gap_shows_errors(self):
+    def test_gap_detection_small_gap_shows_errors(self, success_result):
         """Test that small gaps show as exclamation marks."""
         graph = LatencyGraph(width=10)
 
-        result1 = CheckResult(
-            timestamp=datetime.now(),
-            check_type=CheckType.ICMP,
-            success=True,
-            latency_ms=10.0,
-        )
-
-        result2 = CheckResult(
-            timestamp=datetime.now(),
-            check_type=CheckType.ICMP,
-            success=True,
-            latency_ms=10.0,
-        )
-
         # Small gap of 3 buckets between results (should show as errors)
-        bucketed = [result1, None, None, None, result2, None, None, None, None, None]
+        bucketed = _bucketed(10, {0: success_result, 4: success_result})
         rendered = graph.render(bucketed)
 
         # Gap should be marked with exclamation marks
         assert "!" in rendered.plain
 
-    def test_gap_detection_large_gap_shows_dots(self):
+    def test_gap_detection_large_gap_shows_dots(self, success_result):
         """Test that large gaps show as dots to avoid noise."""
         graph = LatencyGraph(width=50)
 
-        result1 = CheckResult(
-            timestamp=datetime.now(),
-            check_type=CheckType.ICMP,
-            success=True,
-            latency_ms=10.0,
-        )
-
-        result2 = CheckResult(
-            timestamp=datetime.now(),
-            check_type=CheckType.ICMP,
-            success=True,
-            latency_ms=10.0,
-        )
-
         # Large gap of 20 buckets (should show as dots, not errors)
-        bucketed = [result1] + [None] * 20 + [result2] + [None] * 28
+        bucketed = _bucketed(50, {0: success_result, 21: success_result})
         rendered = graph.render(bucketed)
 
         # Large gap should be dots, not exclamation marks
         assert "·" in rendered.plain
+
+    def test_gap_detection_boundary(self, success_result):
+        """Test that gaps up to 10 buckets show errors and longer gaps show dots."""
+        graph = LatencyGraph(width=25)
+
+        rendered = graph.render(_bucketed(25, {0: success_result, 11: success_result}))
+        assert rendered.plain[1:11] == "!" * 10
+        assert rendered.plain[12:] == "·" * 13
+
+        rendered = graph.render(_bucketed(25, {0: success_result, 12: success_result}))
+        assert rendered.plain[1:12] == "·" * 11
+
+
+class TestLatencyColor:
+    """Test latency color thresholds."""
+
+    def test_colors_change_at_thresholds(self):
+        """Test that a latency equal to a threshold gets the next color."""
+        assert get_latency_color(0.0) == "green"
+        assert get_latency_color(LATENCY_GREEN_MAX - 0.1) == "green"
+        assert get_latency_color(LATENCY_GREEN_MAX) == "yellow"
+        assert get_latency_color(LATENCY_YELLOW_MAX) == "orange1"
+        assert get_latency_color(LATENCY_ORANGE_MAX) == "red"
+        assert get_latency_color(10_000.0) == "red"